@@ -2,6 +2,13 @@
 
 __version__ = "0.1.0"
 
-from nf_scanner_core.extractor import NFExtractor
-
 __all__ = ["NFExtractor"]
+
+
+def __getattr__(name):
+    # Importação tardia: PyMuPDF, OpenCV e anthropic só são carregados no primeiro uso
+    if name == "NFExtractor":
+        from nf_scanner_core.extractor import NFExtractor
+
+        return NFExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
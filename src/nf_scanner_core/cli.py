@@ -4,8 +4,6 @@ Interface de linha de comando para NF-Scanner-Core.
 
 import argparse
 import sys
-import os
-from nf_scanner_core import NFExtractor
 import json
 
 
@@ -32,16 +30,27 @@ def main():
         action="store_true",
         help="Usa IA para parsear os dados.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignora os resultados em cache (OCR e respostas da IA) e processa novamente.",
+    )
 
     args = parser.parse_args()
 
-    try:
-        # Verifica se o arquivo existe
-        if not os.path.exists(args.file_path):
-            raise FileNotFoundError(f"O arquivo não foi encontrado: {args.file_path}")
+    # Importado somente após o parsing dos argumentos, para que --help e erros de uso
+    # não paguem o custo de carregar os backends de extração
+    from nf_scanner_core import NFExtractor
 
+    try:
+        # A existência do arquivo é verificada pelo próprio NFExtractor
         # Extrai e salva os dados da NFSe usando a API unificada
-        extractor = NFExtractor(args.file_path, args.ai_extraction, args.ai_parse)
+        extractor = NFExtractor(
+            args.file_path,
+            args.ai_extraction,
+            args.ai_parse,
+            use_cache=not args.no_cache,
+        )
         nfse = extractor.extract()
         print(json.dumps(nfse.to_dict(), indent=2, ensure_ascii=False))
 
@@ -3,13 +3,45 @@ Interface central para extração de NFSe.
 """
 
 import os
-import mimetypes
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
 
-from nf_scanner_core.extractors.pdf_extractor import PDFExtractor
-from nf_scanner_core.extractors.image_extractor import ImageExtractor
-from nf_scanner_core.extractors.ai_image_extractor import AIImageExtractor
+from nf_scanner_core import extractors
 from nf_scanner_core.models import NFSe
 
+# Mapeamento de extensões suportadas para o tipo de arquivo.
+# Evita o uso do mimetypes, que carrega a base de tipos do sistema na primeira chamada.
+_EXT_TO_TYPE = {
+    ".pdf": "pdf",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+}
+
+# Extrator para cada combinação de (tipo de arquivo, extração com IA). As classes são
+# resolvidas no momento da chamada pelo pacote `extractors`, que as importa sob demanda.
+_EXTRACTORS = {
+    ("pdf", False): lambda path, ai_parse, use_cache: extractors.PDFExtractor(
+        path, ai_parse, use_cache=use_cache
+    ),
+    ("image", False): lambda path, ai_parse, use_cache: extractors.ImageExtractor(
+        path, ai_parse, use_cache=use_cache
+    ),
+    # Ao utilizar a IA para extração, não é necessário usar parser.
+    ("image", True): lambda path, ai_parse, use_cache: extractors.AIImageExtractor(
+        path, use_cache=use_cache
+    ),
+}
+
+
+def _extract_one(
+    extract_path: str, ai_extraction: bool, ai_parse: bool, use_cache: bool = True
+) -> NFSe:
+    """
+    Extrai uma única NFSe; função de módulo para poder ser enviada aos processos do pool.
+    """
+    return NFExtractor(extract_path, ai_extraction, ai_parse, use_cache).extract()
+
 
 class NFExtractor:
     """
@@ -18,8 +50,16 @@ class NFExtractor:
     Detecta automaticamente o tipo de arquivo (PDF ou imagem) e utiliza o extrator apropriado.
     """
 
+    SUPPORTED_IMAGE_TYPES = frozenset({"image/jpeg", "image/jpg", "image/png"})
+    SUPPORTED_PDF_TYPES = frozenset({"application/pdf"})
+    SUPPORTED_EXTENSIONS = tuple(_EXT_TO_TYPE)
+
     def __init__(
-        self, extract_path: str, ai_extraction: bool = False, ai_parse: bool = False
+        self,
+        extract_path: str,
+        ai_extraction: bool = False,
+        ai_parse: bool = False,
+        use_cache: bool = True,
     ):
         """
         Inicializa o extrator de NFSe com o caminho do arquivo e caminho de saída opcional.
@@ -28,37 +68,34 @@ class NFExtractor:
             extract_path: Caminho para o arquivo (PDF ou imagem) contendo a NFSe
             ai_extraction: Se True, usa IA para extração; se False, usa OCR
             ai_parse: Se True, usa IA para parsear os dados; se False, usa parseamento manual
+            use_cache: Se True, reutiliza os resultados em cache (OCR e respostas da IA)
+                de arquivos e textos já processados
         """
-        self.SUPPORTED_IMAGE_TYPES = ["image/jpeg", "image/jpg", "image/png"]
-        self.SUPPORTED_PDF_TYPES = ["application/pdf"]
-        self.SUPPORTED_EXTENSIONS = [".pdf", ".jpg", ".jpeg", ".png"]
-
         self.extract_path = extract_path
         self.ai_extraction = ai_extraction
         self.ai_parse = ai_parse
+        self.use_cache = use_cache
         self.file_type = self._determine_file_type()
         if self.file_type == "pdf" and self.ai_extraction:
             raise ValueError(
                 "IA para extração de PDF não é eficiente pois a extração funciona perfeitamente com o PyMuPDF."
             )
 
-        if self.file_type == "pdf":
-            self.extractor = PDFExtractor(self.extract_path, self.ai_parse)
-        elif self.file_type == "image" and not self.ai_extraction:
-            self.extractor = ImageExtractor(self.extract_path, self.ai_parse)
-        elif self.file_type == "image" and self.ai_extraction:
-            self.extractor = AIImageExtractor(
-                self.extract_path
-            )  # Ao utilizar a IA para extração, não é necessário usar parser.
-        else:
+        try:
+            criar_extrator = _EXTRACTORS[(self.file_type, bool(self.ai_extraction))]
+        except KeyError:
             raise ValueError(
                 f"Tipo de arquivo não suportado: {self.extract_path}. "
                 f"Extensões suportadas: {', '.join(self.SUPPORTED_EXTENSIONS)}"
-            )
+            ) from None
+
+        self.extractor = criar_extrator(
+            self.extract_path, self.ai_parse, self.use_cache
+        )
 
     def _determine_file_type(self) -> str:
         """
-        Determina o tipo de arquivo baseado na extensão ou tipo MIME.
+        Determina o tipo de arquivo baseado na extensão.
 
         Returns:
             str: Tipo de arquivo ('pdf', 'image' ou None se não suportado)
@@ -68,14 +105,10 @@ class NFExtractor:
                 f"O arquivo não foi encontrado: {self.extract_path}"
             )
 
-        mime_type, _ = mimetypes.guess_type(self.extract_path)
-        if mime_type in self.SUPPORTED_PDF_TYPES:
-            return "pdf"
-        elif mime_type in self.SUPPORTED_IMAGE_TYPES:
-            return "image"
+        extensao = os.path.splitext(self.extract_path)[1].lower()
 
-        # Não foi possível determinar o tipo de arquivo
-        return None
+        # Retorna None se não foi possível determinar o tipo de arquivo
+        return _EXT_TO_TYPE.get(extensao)
 
     def extract(self) -> NFSe:
         """
@@ -85,3 +118,62 @@ class NFExtractor:
             NFSe: Objeto contendo os dados estruturados da NFSe
         """
         return self.extractor.extract()
+
+    async def extract_async(self) -> NFSe:
+        """
+        Extrai dados da NFSe do arquivo de forma assíncrona.
+
+        Permite executar várias extrações ao mesmo tempo (ex: com asyncio.gather),
+        sobrepondo as chamadas à API e o processamento local.
+
+        Returns:
+            NFSe: Objeto contendo os dados estruturados da NFSe
+        """
+        return await self.extractor.extract_async()
+
+    @classmethod
+    def extract_many(
+        cls,
+        paths: Iterable[str],
+        workers: Optional[int] = None,
+        ai_extraction: bool = False,
+        ai_parse: bool = False,
+        use_cache: bool = True,
+    ) -> List[NFSe]:
+        """
+        Extrai dados de várias NFSe em paralelo, um arquivo por processo.
+
+        A extração de PDF, o OCR e o parsing por regex são limitados por CPU, por isso
+        é usado um pool de processos em vez de threads. Em scripts, a chamada deve ficar
+        sob `if __name__ == "__main__":`, pois no Windows e no macOS (início por spawn)
+        os processos do pool importam o módulo principal novamente.
+
+        Args:
+            paths: Caminhos para os arquivos (PDF ou imagem) das NFSe
+            workers: Número máximo de processos (padrão: número de CPUs)
+            ai_extraction: Se True, usa IA para extração; se False, usa OCR
+            ai_parse: Se True, usa IA para parsear os dados; se False, usa parseamento manual
+            use_cache: Se True, reutiliza os resultados em cache (OCR e respostas da IA)
+
+        Returns:
+            List[NFSe]: Objetos NFSe na mesma ordem dos caminhos informados
+
+        Raises:
+            Exception: A primeira exceção lançada na extração de algum dos arquivos
+        """
+        paths = list(paths)
+        if len(paths) <= 1 or workers == 1:
+            return [
+                _extract_one(path, ai_extraction, ai_parse, use_cache) for path in paths
+            ]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    _extract_one,
+                    paths,
+                    [ai_extraction] * len(paths),
+                    [ai_parse] * len(paths),
+                    [use_cache] * len(paths),
+                )
+            )
@@ -4,8 +4,21 @@ Módulo de extractores para NF-Scanner-Core.
 Este módulo contém as implementações de extractores para diferentes tipos de arquivo.
 """
 
-from nf_scanner_core.extractors.pdf_extractor import PDFExtractor
-from nf_scanner_core.extractors.image_extractor import ImageExtractor
-from nf_scanner_core.extractors.ai_image_extractor import AIImageExtractor
+from importlib import import_module
+
+# Os extratores são importados sob demanda, pois cada um carrega dependências pesadas
+# (PyMuPDF, OpenCV/Tesseract ou anthropic) que só são necessárias para o seu tipo de arquivo
+_LAZY_IMPORTS = {
+    "PDFExtractor": "nf_scanner_core.extractors.pdf_extractor",
+    "ImageExtractor": "nf_scanner_core.extractors.image_extractor",
+    "AIImageExtractor": "nf_scanner_core.extractors.ai_image_extractor",
+}
 
 __all__ = ["PDFExtractor", "ImageExtractor", "AIImageExtractor"]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -7,82 +7,389 @@ o Claude.
 
 import os
 import json
+import asyncio
 import base64
+import hashlib
 import logging
-from typing import Optional, Dict, Any, Union, Tuple
-from pathlib import Path
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import cv2
+import numpy as np
 import anthropic
-from PIL import Image
 
 from nf_scanner_core.models import NFSe
 from nf_scanner_core.parsers.ai_nfse_parser import AINFSeParser, AIParseError
 from nf_scanner_core.utils.config import (
+    get_config,
     get_ai_api_key,
     get_ai_model,
     get_ai_model_alias,
+    get_ai_max_tokens,
 )
+from nf_scanner_core.utils.ai_client import get_ai_client
 from nf_scanner_core.utils.ai_prompts import (
     NFSE_STRUCTURED_DATA_PROMPT,
+    NFSE_STRUCTURED_DATA_SYSTEM,
     STRUCTURED_DATA_USER_TEXT,
 )
+from nf_scanner_core.utils.cache import cache_get, cache_set, make_cache_key
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
+# Maior lado (em pixels) aproveitado pelo Claude; imagens maiores são reduzidas pela própria API.
+# Podem ser ajustados com NF_SCANNER_AI_IMAGE_MAX_EDGE e NF_SCANNER_AI_IMAGE_QUALITY.
+_MAX_LADO_IMAGEM = 1568
+_QUALIDADE_JPEG = 85
+
+# Bloco de texto fixo enviado junto com a imagem, montado uma única vez
+_USER_TEXT_BLOCK = {"type": "text", "text": STRUCTURED_DATA_USER_TEXT}
+
+# Cache de respostas: invalida automaticamente as entradas quando os prompts mudam
+_CACHE_NAMESPACE = "ai_image"
+_PROMPT_VERSION = make_cache_key(NFSE_STRUCTURED_DATA_PROMPT, STRUCTURED_DATA_USER_TEXT)
+
+_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+
+
+def _dimensoes_jpeg(dados: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Lê a altura e a largura do cabeçalho de quadro (SOF) de um JPEG.
+
+    Args:
+        dados: Bytes do arquivo JPEG
+
+    Returns:
+        Tupla (altura, largura), ou None se o cabeçalho não for encontrado
+    """
+    if not dados.startswith(b"\xff\xd8"):
+        return None
+
+    posicao = 2
+    while posicao + 9 <= len(dados):
+        if dados[posicao] != 0xFF:
+            return None
+        marcador = dados[posicao + 1]
+        if marcador == 0xFF:  # Bytes de preenchimento entre segmentos
+            posicao += 1
+            continue
+        # SOF0 a SOF15, exceto DHT (C4), JPG (C8) e DAC (CC), que usam a mesma faixa
+        if 0xC0 <= marcador <= 0xCF and marcador not in (0xC4, 0xC8, 0xCC):
+            return struct.unpack_from(">HH", dados, posicao + 5)
+        posicao += 2 + int.from_bytes(dados[posicao + 2 : posicao + 4], "big")
+
+    return None
+
 
 class AIImageExtractor:
     """
     Classe para extração de texto e dados estruturados de imagens usando a API do Claude.
     """
 
-    def __init__(self, image_path: str):
+    def __init__(self, image_path: str, use_cache: bool = True):
         """
         Inicializa o extrator de imagem com IA com o caminho para o arquivo de imagem.
 
         Args:
             image_path: Caminho para o arquivo de imagem
+            use_cache: Se True, reutiliza respostas em cache para imagens já processadas
         """
         self.image_path = image_path
+        self.use_cache = use_cache
         self.api_key = get_ai_api_key()
         self.model = get_ai_model()
         self.model_alias = get_ai_model_alias()
+        self.max_edge = int(
+            get_config("NF_SCANNER_AI_IMAGE_MAX_EDGE", _MAX_LADO_IMAGEM)
+        )
+        self.jpeg_quality = int(
+            get_config("NF_SCANNER_AI_IMAGE_QUALITY", _QUALIDADE_JPEG)
+        )
 
         if not self.api_key:
             error_msg = "Chave de API do Claude não configurada. Configure CLAUDE_API_KEY no arquivo .env"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-    def _encode_image(self) -> str:
+    def _read_image(self) -> bytes:
         """
-        Codifica imagem em base64 para envio para a API.
+        Lê o arquivo de imagem uma única vez; os bytes são reaproveitados no hash do
+        cache, na decodificação e na codificação em base64.
 
         Returns:
-            String com a imagem codificada em base64
+            Bytes do arquivo de imagem
 
         Raises:
             IOError: Se houver um erro na leitura do arquivo
         """
         try:
             with open(self.image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode("utf-8")
+                return image_file.read()
         except IOError as e:
-            logger.error(f"Erro ao ler o arquivo {self.image_path}: {str(e)}")
+            logger.error("Erro ao ler o arquivo %s: %s", self.image_path, e)
             raise IOError(f"Erro ao ler o arquivo de imagem: {str(e)}")
 
+    def _maybe_downscale(self, dados: bytes) -> Optional[bytes]:
+        """
+        Reduz a imagem para o maior lado aceito pelo Claude e a recodifica como JPEG em
+        escala de cinza (a cor não contribui para a leitura da NFSe e aumenta o tamanho).
+
+        Imagens que não estão em JPEG (ex: PNG) são sempre recodificadas, pois costumam
+        ser bem maiores que o equivalente em JPEG para o mesmo conteúdo.
+
+        Args:
+            dados: Bytes do arquivo de imagem
+
+        Returns:
+            Bytes da imagem JPEG reduzida, ou None se a imagem já for um JPEG dentro do
+            limite (ou não puder ser decodificada) e puder ser enviada como está
+        """
+        # Um JPEG dentro do limite é enviado como está; as dimensões vêm do cabeçalho,
+        # sem decodificar a imagem
+        extensao = os.path.splitext(self.image_path)[1].lower()
+        if _MEDIA_TYPES.get(extensao) == "image/jpeg":
+            dimensoes = _dimensoes_jpeg(dados)
+            if dimensoes and max(dimensoes) <= self.max_edge:
+                return None
+
+        imagem = cv2.imdecode(
+            np.frombuffer(dados, dtype=np.uint8), cv2.IMREAD_GRAYSCALE
+        )
+        if imagem is None:
+            return None
+
+        altura, largura = imagem.shape[:2]
+        escala = self.max_edge / max(altura, largura)
+
+        if escala < 1:
+            imagem = cv2.resize(
+                imagem, None, fx=escala, fy=escala, interpolation=cv2.INTER_AREA
+            )
+        sucesso, dados = cv2.imencode(
+            ".jpg", imagem, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        )
+        if not sucesso:
+            return None
+
+        logger.info(
+            "Imagem %s preparada de %dx%d para %dx%d (JPEG em cinza) antes do envio",
+            self.image_path,
+            largura,
+            altura,
+            imagem.shape[1],
+            imagem.shape[0],
+        )
+        return dados.tobytes()
+
+    def _prepare_image(self, dados: bytes) -> Tuple[str, str]:
+        """
+        Prepara a imagem para envio à API, reduzindo-a quando necessário.
+
+        Args:
+            dados: Bytes do arquivo de imagem
+
+        Returns:
+            Tupla com a imagem codificada em base64 e o seu media type
+        """
+        reduzida = self._maybe_downscale(dados)
+        if reduzida is not None:
+            return base64.b64encode(reduzida).decode("ascii"), "image/jpeg"
+
+        extensao = os.path.splitext(self.image_path)[1].lower()
+        return (
+            base64.b64encode(dados).decode("ascii"),
+            _MEDIA_TYPES.get(extensao, "image/jpeg"),
+        )
+
     def _get_client(self) -> anthropic.Anthropic:
         """
-        Retorna cliente da API do Claude.
+        Retorna cliente da API do Claude, compartilhado entre as instâncias.
 
         Returns:
             Cliente configurado da API Anthropic
         """
-        return anthropic.Anthropic(api_key=self.api_key)
+        return get_ai_client(self.api_key)
+
+    def _cache_key(self, dados: bytes) -> str:
+        """
+        Gera a chave do cache de respostas para a imagem.
+
+        A chave combina o hash do conteúdo do arquivo com o modelo, a versão do prompt e
+        os parâmetros de preparo da imagem, que influenciam a resposta.
+
+        Args:
+            dados: Bytes do arquivo de imagem
+
+        Returns:
+            str: Chave do cache
+        """
+        return make_cache_key(
+            hashlib.sha256(dados).hexdigest(),
+            self.model,
+            _PROMPT_VERSION,
+            self.max_edge,
+            self.jpeg_quality,
+            "gray",
+        )
+
+    def _build_request(self, base64_image: str, media_type: str) -> Dict[str, Any]:
+        """
+        Monta os parâmetros da chamada à API de mensagens para a imagem.
+
+        Args:
+            base64_image: Imagem codificada em base64
+            media_type: Media type da imagem
+
+        Returns:
+            Dict com os argumentos para `messages.create`
+        """
+        return {
+            "model": self.model,
+            "max_tokens": get_ai_max_tokens(),
+            "system": NFSE_STRUCTURED_DATA_SYSTEM,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        _USER_TEXT_BLOCK,
+                        {
+                            "type": "image",
+                            "source": {
+                                "type": "base64",
+                                "media_type": media_type,
+                                "data": base64_image,
+                            },
+                        },
+                    ],
+                }
+            ],
+        }
+
+    def _parse_response(self, response: Any) -> Dict[str, Any]:
+        """
+        Converte a resposta da API no JSON com os dados estruturados.
+
+        Args:
+            response: Resposta retornada por `messages.create`
+
+        Returns:
+            Dict com os dados estruturados retornados pelo Claude
+
+        Raises:
+            AIParseError: Se a resposta não for um JSON válido ou tiver sido truncada
+                pelo limite de tokens
+        """
+        if response.stop_reason == "max_tokens":
+            raise AIParseError(
+                "Resposta do Claude truncada pelo limite de tokens de saída. "
+                "Aumente NF_SCANNER_AI_MAX_TOKENS"
+            )
+
+        try:
+            result = AINFSeParser._carregar_json(response.content[0].text)
+        except json.JSONDecodeError as e:
+            raise AIParseError(
+                f"Erro ao fazer o parsing do JSON retornado pelo Claude: {str(e)}"
+            )
+
+        logger.info(
+            "Dados estruturados extraídos com sucesso da imagem %s", self.image_path
+        )
+        return result
+
+    def _load_cached(
+        self, dados: bytes
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Consulta o cache de respostas para a imagem.
+
+        Args:
+            dados: Bytes do arquivo de imagem
+
+        Returns:
+            Tupla com a chave do cache (None se o cache estiver desabilitado) e a
+            resposta armazenada (None se não houver)
+        """
+        if not self.use_cache:
+            return None, None
+
+        cache_key = self._cache_key(dados)
+        result = cache_get(_CACHE_NAMESPACE, cache_key)
+        if result is not None:
+            logger.info(
+                "Dados estruturados da imagem %s obtidos do cache", self.image_path
+            )
+        return cache_key, result
+
+    def _request_structured_data(self, dados: bytes) -> Dict[str, Any]:
+        """
+        Envia a imagem para a API do Claude e retorna o JSON da resposta.
+
+        Args:
+            dados: Bytes do arquivo de imagem
+
+        Returns:
+            Dict com os dados estruturados retornados pelo Claude
+
+        Raises:
+            AIParseError: Se a resposta não for um JSON válido
+        """
+        base64_image, media_type = self._prepare_image(dados)
+        client = self._get_client()
+
+        logger.info(
+            "Enviando imagem para extração de dados estruturados com Claude %s",
+            self.model_alias,
+        )
+
+        response = client.messages.create(
+            **self._build_request(base64_image, media_type)
+        )
+        return self._parse_response(response)
+
+    async def _request_structured_data_async(
+        self, dados: bytes, client: anthropic.AsyncAnthropic
+    ) -> Dict[str, Any]:
+        """
+        Versão assíncrona de `_request_structured_data`.
+
+        O preparo da imagem (decodificação, redimensionamento e base64) é executado em
+        uma thread separada para não bloquear o event loop.
+
+        Args:
+            dados: Bytes do arquivo de imagem
+            client: Cliente assíncrono da API Anthropic
+
+        Returns:
+            Dict com os dados estruturados retornados pelo Claude
+
+        Raises:
+            AIParseError: Se a resposta não for um JSON válido
+        """
+        base64_image, media_type = await asyncio.to_thread(self._prepare_image, dados)
+
+        logger.info(
+            "Enviando imagem para extração de dados estruturados com Claude %s",
+            self.model_alias,
+        )
+
+        response = await client.messages.create(
+            **self._build_request(base64_image, media_type)
+        )
+        return self._parse_response(response)
 
     def _extract_structured_data(self) -> NFSe:
         """
         Extrai dados estruturados de uma imagem de NFSe usando a API do Claude.
 
+        Quando o cache está habilitado, a resposta de uma imagem já processada é
+        reutilizada sem uma nova chamada à API.
+
         Returns:
             Objeto NFSe com os dados estruturados extraídos
 
@@ -90,54 +397,61 @@ class AIImageExtractor:
             Exception: Se houver um erro na extração
         """
         try:
-            base64_image = self._encode_image()
-            client = self._get_client()
+            dados = self._read_image()
+            cache_key, result = self._load_cached(dados)
+            if result is None:
+                result = self._request_structured_data(dados)
 
-            logger.info(
-                f"Enviando imagem para extração de dados estruturados com Claude {self.model_alias}"
-            )
+            nfse = AINFSeParser._converter_para_modelos(result)
 
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                system=NFSE_STRUCTURED_DATA_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": STRUCTURED_DATA_USER_TEXT},
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/jpeg",
-                                    "data": base64_image,
-                                },
-                            },
-                        ],
-                    }
-                ],
+            # Armazena apenas respostas que resultaram em uma NFSe válida
+            if cache_key:
+                cache_set(_CACHE_NAMESPACE, cache_key, result)
+
+            return nfse
+
+        except (ValueError, IOError, AIParseError) as e:
+            logger.error("Erro na extração de dados estruturados: %s", e)
+            raise e
+        except Exception as e:
+            logger.error("Erro inesperado na extração de dados estruturados: %s", e)
+            raise Exception(
+                f"Erro na extração de dados estruturados da imagem: {str(e)}"
             )
 
-            content = response.content[0].text
-            content = content.replace("```json", "").replace("```", "").strip()
+    async def _extract_structured_data_async(
+        self, client: anthropic.AsyncAnthropic
+    ) -> NFSe:
+        """
+        Versão assíncrona de `_extract_structured_data`.
+
+        Args:
+            client: Cliente assíncrono da API Anthropic
+
+        Returns:
+            Objeto NFSe com os dados estruturados extraídos
+
+        Raises:
+            Exception: Se houver um erro na extração
+        """
+        try:
+            dados = await asyncio.to_thread(self._read_image)
+            cache_key, result = await asyncio.to_thread(self._load_cached, dados)
+            if result is None:
+                result = await self._request_structured_data_async(dados, client)
+
+            nfse = AINFSeParser._converter_para_modelos(result)
+
+            if cache_key:
+                await asyncio.to_thread(cache_set, _CACHE_NAMESPACE, cache_key, result)
 
-            try:
-                result = json.loads(content)
-                logger.info(
-                    f"Dados estruturados extraídos com sucesso da imagem {self.image_path}"
-                )
-                return AINFSeParser._converter_para_modelos(result)
-            except json.JSONDecodeError as e:
-                raise AIParseError(
-                    f"Erro ao fazer o parsing do JSON retornado pelo Claude: {str(e)}"
-                )
+            return nfse
 
         except (ValueError, IOError, AIParseError) as e:
-            logger.error(f"Erro na extração de dados estruturados: {str(e)}")
+            logger.error("Erro na extração de dados estruturados: %s", e)
             raise e
         except Exception as e:
-            logger.error(f"Erro inesperado na extração de dados estruturados: {str(e)}")
+            logger.error("Erro inesperado na extração de dados estruturados: %s", e)
             raise Exception(
                 f"Erro na extração de dados estruturados da imagem: {str(e)}"
             )
@@ -150,3 +464,61 @@ class AIImageExtractor:
             NFSe: objeto NFSe com os dados extraídos
         """
         return self._extract_structured_data()
+
+    async def extract_async(
+        self, client: Optional[anthropic.AsyncAnthropic] = None
+    ) -> NFSe:
+        """
+        Extrai dados de uma NFSe a partir de uma imagem de forma assíncrona.
+
+        Args:
+            client: Cliente assíncrono da API Anthropic a ser reutilizado. Se não for
+                informado, um cliente é criado e fechado ao final da chamada.
+
+        Returns:
+            NFSe: objeto NFSe com os dados extraídos
+        """
+        if client is not None:
+            return await self._extract_structured_data_async(client)
+
+        async with anthropic.AsyncAnthropic(api_key=self.api_key) as client:
+            return await self._extract_structured_data_async(client)
+
+    @classmethod
+    async def extract_many_async(
+        cls,
+        image_paths: Iterable[str],
+        max_concurrency: int = 5,
+        use_cache: bool = True,
+    ) -> List[Union[NFSe, Exception]]:
+        """
+        Extrai dados de várias imagens de NFSe com chamadas concorrentes à API.
+
+        As chamadas à API são limitadas por rede, então são feitas em paralelo, até
+        `max_concurrency` ao mesmo tempo para respeitar os limites de taxa do provedor.
+        Uma falha em uma imagem não interrompe as demais: a exceção é devolvida na
+        posição daquela imagem, em vez de ser lançada (ao contrário do
+        `NFExtractor.extract_many`, que lança a primeira falha).
+
+        Args:
+            image_paths: Caminhos para os arquivos de imagem
+            max_concurrency: Número máximo de requisições simultâneas
+            use_cache: Se True, reutiliza respostas em cache para imagens já processadas
+
+        Returns:
+            List com o objeto NFSe de cada imagem, na ordem informada, ou a exceção
+            lançada na extração daquela imagem
+        """
+        semaforo = asyncio.Semaphore(max_concurrency)
+
+        async with anthropic.AsyncAnthropic(api_key=get_ai_api_key()) as client:
+
+            async def extrair(image_path: str) -> NFSe:
+                async with semaforo:
+                    extractor = cls(image_path, use_cache=use_cache)
+                    return await extractor.extract_async(client)
+
+            return await asyncio.gather(
+                *(extrair(image_path) for image_path in image_paths),
+                return_exceptions=True,
+            )
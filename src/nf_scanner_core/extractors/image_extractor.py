@@ -4,15 +4,29 @@ Módulo de extração de texto de arquivos de imagem para NF-Scanner-Core.
 Este módulo fornece a interface para extrair texto de arquivos de imagem utilizando Tesseract.
 """
 
-import os
+import asyncio
+import hashlib
+from typing import Optional
 import cv2
 import numpy as np
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
 
 from nf_scanner_core.models import NFSe
-from nf_scanner_core.parsers.ai_nfse_parser import AINFSeParser
 from nf_scanner_core.parsers.nfse_parser import NFSeParser
+from nf_scanner_core.utils.cache import cache_get, cache_set, make_cache_key
+
+# Largura mínima (em pixels) para o OCR; imagens menores são ampliadas no pré-processamento
+_LARGURA_MINIMA_OCR = 1000
+
+# Fator máximo de ampliação; acima disso o custo do OCR cresce sem ganho de precisão
+_ESCALA_MAXIMA_OCR = 2.5
+
+# Proporção mínima de pixels próximos do preto ou do branco para considerar a imagem uma
+# digitalização limpa, que dispensa a binarização (o Tesseract já binariza internamente)
+_PROPORCAO_IMAGEM_LIMPA = 0.98
+_LADO_MINIATURA = 256
+
+_CACHE_NAMESPACE = "ocr"
 
 
 class ImageExtractor:
@@ -20,54 +34,96 @@ class ImageExtractor:
     Classe responsável por extrair texto e dados estruturados de arquivos de imagem.
     """
 
-    def __init__(self, image_path: str, ai_parse: bool = False):
+    # Parâmetros padrão do Tesseract; podem ser ajustados por aplicações que processam
+    # outros layouts, sem precisar de subclasse
+    DEFAULT_CONFIG = {"psm": 6, "oem": 1, "lang": "por"}
+
+    def __init__(
+        self,
+        image_path: str,
+        ai_parse: bool = False,
+        force_preprocess: bool = False,
+        use_cache: bool = True,
+        psm: Optional[int] = None,
+        oem: Optional[int] = None,
+        lang: Optional[str] = None,
+    ):
         """
         Inicializa o extrator de imagem com o caminho para o arquivo de imagem.
 
         Args:
             image_path: Caminho para o arquivo de imagem
+            ai_parse: Se True, usa IA para parsear os dados; se False, usa parseamento manual
+            force_preprocess: Se True, sempre pré-processa a imagem, mesmo que ela já
+                seja uma digitalização limpa
+            use_cache: Se True, reutiliza o texto em cache de imagens já processadas (e,
+                com ai_parse, as respostas em cache do parsing por IA)
+            psm: Modo de segmentação de página do Tesseract (padrão em DEFAULT_CONFIG)
+            oem: Modo do motor OCR do Tesseract (padrão em DEFAULT_CONFIG)
+            lang: Idioma(s) do Tesseract, ex: "por" ou "por+eng" (padrão em DEFAULT_CONFIG)
         """
         self.image_path = image_path
         self.ai_parse = ai_parse
+        self.force_preprocess = force_preprocess
+        self.use_cache = use_cache
+        self.psm = self.DEFAULT_CONFIG["psm"] if psm is None else psm
+        self.oem = self.DEFAULT_CONFIG["oem"] if oem is None else oem
+        self.lang = self.DEFAULT_CONFIG["lang"] if lang is None else lang
+
+    @staticmethod
+    def _is_clean_scan(gray: np.ndarray) -> bool:
+        """
+        Verifica se a imagem já é uma digitalização limpa, em alta resolução e com
+        texto e fundo bem separados, dispensando o pré-processamento.
+
+        A verificação é feita sobre uma miniatura, para não percorrer a imagem inteira.
+
+        Args:
+            gray: Imagem em escala de cinza
+
+        Returns:
+            bool: True se a imagem pode ser enviada diretamente ao OCR
+        """
+        height, width = gray.shape
+        if width < _LARGURA_MINIMA_OCR:
+            return False
+
+        escala = _LADO_MINIATURA / max(height, width)
+        miniatura = cv2.resize(
+            gray, None, fx=escala, fy=escala, interpolation=cv2.INTER_NEAREST
+        )
+        extremos = np.count_nonzero((miniatura <= 64) | (miniatura >= 192))
+        return extremos / miniatura.size >= _PROPORCAO_IMAGEM_LIMPA
 
-    def _preprocess_image(self, image: Image.Image) -> Image.Image:
+    def _preprocess_image(self, gray: np.ndarray) -> np.ndarray:
         """
         Pré-processa a imagem para melhorar a qualidade do OCR.
 
-        Implementa várias técnicas recomendadas pela documentação do Tesseract, por exemplo:
+        Implementa técnicas recomendadas pela documentação do Tesseract, por exemplo:
         - Redimensionamento (rescaling)
         - Binarização (thresholding)
-        - Remoção de ruído
 
         Args:
-            image: Imagem original em formato PIL
+            gray: Imagem original em escala de cinza (array uint8 do OpenCV)
 
         Returns:
-            Image.Image: Imagem processada para melhor qualidade de OCR
+            np.ndarray: Imagem binarizada para melhor qualidade de OCR
         """
 
-        # Converte para RGB se for RGBA (remove canal alpha)
-        if image.mode == "RGBA":
-            image = image.convert("RGB")
-        img_np = np.array(image)
-
-        # Converte para escala de cinza
-        if len(img_np.shape) == 3:
-            gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY)
-        else:
-            gray = img_np
-
         # Redimensiona para garantir boa resolução
         # Tesseract funciona melhor com pelo menos 300 DPI
         height, width = gray.shape
-        if width < 1000:  # Um heurística simples para imagens pequenas
-            scale_factor = 1500 / width
+        if width < _LARGURA_MINIMA_OCR:  # Um heurística simples para imagens pequenas
+            scale_factor = min(1500 / width, _ESCALA_MAXIMA_OCR)
+            # Para ampliações moderadas a interpolação linear é suficiente para o OCR e
+            # bem mais barata; a cúbica fica reservada para imagens muito pequenas
+            interpolation = cv2.INTER_CUBIC if scale_factor > 2 else cv2.INTER_LINEAR
             gray = cv2.resize(
                 gray,
                 None,
                 fx=scale_factor,
                 fy=scale_factor,
-                interpolation=cv2.INTER_CUBIC,
+                interpolation=interpolation,
             )
 
         # Aplica binarização adaptativa (melhora contraste do texto)
@@ -75,11 +131,7 @@ class ImageExtractor:
             gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
         )
 
-        # Remoção de ruído com filtro morfológico
-        kernel = np.ones((1, 1), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
-
-        return Image.fromarray(binary)
+        return binary
 
     def _extract_text(self) -> str:
         """
@@ -92,28 +144,58 @@ class ImageExtractor:
             FileNotFoundError: Se o arquivo de imagem não for encontrado
             RuntimeError: Se houver um erro ao processar a imagem
         """
-        if not os.path.exists(self.image_path):
-            raise FileNotFoundError(
-                f"O arquivo de imagem não foi encontrado: {self.image_path}"
-            )
-
         try:
-            # Abre a imagem usando PIL
-            image = Image.open(self.image_path)
-
-            # Pré-processa a imagem para melhorar a qualidade do OCR
-            processed_image = self._preprocess_image(image)
-
             # Adiciona configurações adicionais para o Tesseract
-            config = "--psm 6 --oem 1"
+            lang = self.lang
+            config = f"--psm {self.psm} --oem {self.oem}"
+
+            data = np.fromfile(self.image_path, dtype=np.uint8)
+
+            # Consulta o cache pelo conteúdo do arquivo e pelos parâmetros do OCR, antes
+            # de decodificar e pré-processar a imagem
+            cache_key = None
+            if self.use_cache:
+                file_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+                cache_key = make_cache_key(
+                    file_hash,
+                    self.force_preprocess,
+                    _LARGURA_MINIMA_OCR,
+                    _ESCALA_MAXIMA_OCR,
+                    lang,
+                    config,
+                )
+                cached_text = cache_get(_CACHE_NAMESPACE, cache_key)
+                if cached_text is not None:
+                    return cached_text
+
+            # Decodifica a imagem já em escala de cinza com o OpenCV, sem passar pelo PIL
+            # (np.fromfile também suporta caminhos com caracteres não-ASCII)
+            image = cv2.imdecode(data, cv2.IMREAD_GRAYSCALE)
+            if image is None:
+                raise ValueError(f"Formato de imagem não suportado: {self.image_path}")
+
+            # Pré-processa a imagem para melhorar a qualidade do OCR, exceto quando ela
+            # já é uma digitalização limpa
+            if self.force_preprocess or not self._is_clean_scan(image):
+                processed_image = self._preprocess_image(image)
+            else:
+                processed_image = image
 
             # Extrai o texto usando pytesseract
             extracted_text = pytesseract.image_to_string(
-                processed_image, lang="por", config=config
-            )
+                processed_image, lang=lang, config=config
+            ).strip()
+
+            if cache_key:
+                cache_set(_CACHE_NAMESPACE, cache_key, extracted_text)
 
-            return extracted_text.strip()
+            return extracted_text
 
+        # A ausência do arquivo é detectada na leitura, sem um stat prévio
+        except FileNotFoundError as e:
+            raise FileNotFoundError(
+                f"O arquivo de imagem não foi encontrado: {self.image_path}"
+            ) from e
         except Exception as e:
             raise RuntimeError(f"Erro ao extrair o texto da imagem: {str(e)}")
 
@@ -126,6 +208,21 @@ class ImageExtractor:
         """
         text = self._extract_text()
         if self.ai_parse:
-            return AINFSeParser.parse(text)
+            # Importado sob demanda, para não carregar o SDK anthropic no OCR comum
+            from nf_scanner_core.parsers.ai_nfse_parser import AINFSeParser
+
+            return AINFSeParser.parse(text, use_cache=self.use_cache)
 
         return NFSeParser.parse(text)
+
+    async def extract_async(self) -> NFSe:
+        """
+        Extrai dados de uma NFSe a partir de uma imagem de forma assíncrona.
+
+        A leitura do arquivo, a extração do texto e o parsing são bloqueantes, por isso
+        são executados em uma thread separada, sem bloquear o event loop.
+
+        Returns:
+            NFSe: Objeto NFSe com os dados extraídos
+        """
+        return await asyncio.to_thread(self.extract)
@@ -5,11 +5,35 @@ Este módulo fornece a interface para extrair texto de arquivos PDF utilizando P
 """
 
 import os
+import asyncio
+from functools import lru_cache
+
 import pymupdf
 
 from nf_scanner_core.models import NFSe
 from nf_scanner_core.parsers.nfse_parser import NFSeParser
-from nf_scanner_core.parsers.ai_nfse_parser import AINFSeParser
+
+
+@lru_cache(maxsize=32)
+def _extrair_texto_pdf(pdf_path: str, mtime_ns: int, tamanho: int) -> str:
+    """
+    Extrai o texto de todas as páginas de um PDF, memorizando o resultado.
+
+    A data de modificação e o tamanho do arquivo fazem parte da chave do cache, para que
+    um arquivo alterado seja lido novamente.
+
+    Args:
+        pdf_path: Caminho para o arquivo PDF
+        mtime_ns: Data de modificação do arquivo, em nanossegundos
+        tamanho: Tamanho do arquivo, em bytes
+
+    Returns:
+        str: Texto extraído do arquivo PDF
+    """
+    # Itera sobre as páginas e junta o texto de uma vez, evitando concatenações
+    # sucessivas de string; o documento é fechado mesmo em caso de erro
+    with pymupdf.open(pdf_path) as doc:
+        return "\n".join(page.get_text() for page in doc).strip()
 
 
 class PDFExtractor:
@@ -17,15 +41,19 @@ class PDFExtractor:
     Classe responsável por extrair texto e dados estruturados de arquivos PDF.
     """
 
-    def __init__(self, pdf_path: str, ai_parse: bool = False):
+    def __init__(self, pdf_path: str, ai_parse: bool = False, use_cache: bool = True):
         """
         Inicializa o extrator de PDF com o caminho para o arquivo PDF.
 
         Args:
             pdf_path: Caminho para o arquivo PDF
+            ai_parse: Se True, usa IA para parsear os dados; se False, usa parseamento manual
+            use_cache: Se True, reutiliza o texto já extraído de PDFs inalterados e as
+                respostas em cache do parsing por IA
         """
         self.pdf_path = pdf_path
         self.ai_parse = ai_parse
+        self.use_cache = use_cache
 
     def _extract_text(self) -> str:
         """
@@ -38,24 +66,20 @@ class PDFExtractor:
             FileNotFoundError: Se o arquivo PDF não for encontrado
             RuntimeError: Se houver um erro ao ler o arquivo PDF
         """
-        if not os.path.exists(self.pdf_path):
-            raise FileNotFoundError(
-                f"O arquivo PDF não foi encontrado: {self.pdf_path}"
-            )
-
-        extracted_text = ""
-
         try:
-            doc = pymupdf.open(self.pdf_path)
-            for page_num in range(
-                len(doc)
-            ):  # Itera sobre todas as páginas do documento
-                page = doc[page_num]
-                extracted_text += page.get_text() + "\n"
-            doc.close()
-
-            return extracted_text.strip()
+            # O stat fornece a chave do cache em memória (e já detecta a ausência do
+            # arquivo); com use_cache=False, o PDF é sempre lido novamente
+            info = os.stat(self.pdf_path)
+            extrair = (
+                _extrair_texto_pdf if self.use_cache else _extrair_texto_pdf.__wrapped__
+            )
+            return extrair(os.fspath(self.pdf_path), info.st_mtime_ns, info.st_size)
 
+        # O PyMuPDF tem a sua própria exceção, que não herda do FileNotFoundError
+        except (FileNotFoundError, pymupdf.FileNotFoundError) as e:
+            raise FileNotFoundError(
+                f"O arquivo PDF não foi encontrado: {self.pdf_path}"
+            ) from e
         except Exception as e:
             raise RuntimeError(f"Erro ao extrair o texto do PDF: {str(e)}")
 
@@ -68,6 +92,21 @@ class PDFExtractor:
         """
         text = self._extract_text()
         if self.ai_parse:
-            return AINFSeParser.parse(text)
+            # Só a leitura com IA precisa do SDK anthropic; a extração de texto do PDF não
+            from nf_scanner_core.parsers.ai_nfse_parser import AINFSeParser
+
+            return AINFSeParser.parse(text, use_cache=self.use_cache)
         else:
             return NFSeParser.parse(text)
+
+    async def extract_async(self) -> NFSe:
+        """
+        Extrai dados de uma NFSe a partir de um PDF de forma assíncrona.
+
+        A leitura do arquivo, a extração do texto e o parsing são bloqueantes, por isso
+        são executados em uma thread separada, sem bloquear o event loop.
+
+        Returns:
+            NFSe: Objeto NFSe com os dados extraídos
+        """
+        return await asyncio.to_thread(self.extract)
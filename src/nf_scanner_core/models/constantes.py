@@ -0,0 +1,9 @@
+"""
+Constantes compartilhadas pelos modelos e parsers.
+"""
+
+from decimal import Decimal
+
+# Decimal é imutável, então os valores padrão dos modelos e os campos ausentes nos
+# parsers compartilham o mesmo objeto
+ZERO = Decimal("0.00")
@@ -9,7 +9,7 @@ from nf_scanner_core.models.endereco import Endereco
 from nf_scanner_core.models.contato import Contato
 
 
-@dataclass
+@dataclass(slots=True)
 class Empresa:
     """Representa informações de uma empresa (prestador ou tomador)."""
 
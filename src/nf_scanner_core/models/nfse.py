@@ -2,8 +2,10 @@
 Modelo principal que representa a NFSe (Nota Fiscal de Serviço Eletrônica).
 """
 
-from dataclasses import dataclass, field
-from typing import Union
+from dataclasses import dataclass, field, fields, is_dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Union
 from datetime import datetime
 
 from nf_scanner_core.models.empresa import Empresa
@@ -11,8 +13,26 @@ from nf_scanner_core.models.servico_detalhe import ServicoDetalhe
 from nf_scanner_core.models.valores import Valores
 from nf_scanner_core.models.tributos_federais import TributosFederais
 
+# Os campos de cada dataclass são imutáveis, então são obtidos uma única vez por classe
+_campos = lru_cache(maxsize=None)(fields)
 
-@dataclass
+
+def _serializar(obj: Any) -> Any:
+    """Converte recursivamente um valor para tipos serializáveis em JSON, em uma passada."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return {f.name: _serializar(getattr(obj, f.name)) for f in _campos(type(obj))}
+    if isinstance(obj, (list, tuple)):
+        return [_serializar(item) for item in obj]
+    if isinstance(obj, dict):
+        return {k: _serializar(v) for k, v in obj.items()}
+    return obj
+
+
+@dataclass(slots=True)
 class NFSe:
     """
     Modelo que representa a NFSe.
@@ -47,21 +67,4 @@ class NFSe:
         Returns:
             dict: Representação do NFSe em formato de dicionário
         """
-        import dataclasses
-        from decimal import Decimal
-        from datetime import datetime
-
-        def serialize(obj):
-            if isinstance(obj, Decimal):
-                return float(obj)
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if dataclasses.is_dataclass(obj):
-                return {k: serialize(v) for k, v in dataclasses.asdict(obj).items()}
-            if isinstance(obj, (list, tuple)):
-                return [serialize(item) for item in obj]
-            if isinstance(obj, dict):
-                return {k: serialize(v) for k, v in obj.items()}
-            return obj
-
-        return serialize(self)
+        return _serializar(self)
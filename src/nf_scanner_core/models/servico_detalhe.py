@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ServicoDetalhe:
     """Representa detalhes do serviço prestado."""
 
@@ -5,13 +5,15 @@ Modelo que representa valores dos tributos federais.
 from dataclasses import dataclass
 from decimal import Decimal
 
+from nf_scanner_core.models.constantes import ZERO
 
-@dataclass
+
+@dataclass(slots=True)
 class TributosFederais:
     """Representa valores dos tributos federais."""
 
-    pis: Decimal = Decimal("0.00")
-    cofins: Decimal = Decimal("0.00")
-    ir: Decimal = Decimal("0.00")
-    inss: Decimal = Decimal("0.00")
-    csll: Decimal = Decimal("0.00")
+    pis: Decimal = ZERO
+    cofins: Decimal = ZERO
+    ir: Decimal = ZERO
+    inss: Decimal = ZERO
+    csll: Decimal = ZERO
@@ -5,16 +5,18 @@ Modelo que representa valores financeiros da nota fiscal.
 from dataclasses import dataclass
 from decimal import Decimal
 
+from nf_scanner_core.models.constantes import ZERO
 
-@dataclass
+
+@dataclass(slots=True)
 class Valores:
     """Representa valores financeiros da nota fiscal."""
 
     valor_servicos: Decimal
-    desconto: Decimal = Decimal("0.00")
-    valor_liquido: Decimal = Decimal("0.00")
-    base_calculo: Decimal = Decimal("0.00")
-    aliquota: Decimal = Decimal("0.00")
-    valor_iss: Decimal = Decimal("0.00")
-    outras_retencoes: Decimal = Decimal("0.00")
-    retencoes_federais: Decimal = Decimal("0.00")
+    desconto: Decimal = ZERO
+    valor_liquido: Decimal = ZERO
+    base_calculo: Decimal = ZERO
+    aliquota: Decimal = ZERO
+    valor_iss: Decimal = ZERO
+    outras_retencoes: Decimal = ZERO
+    retencoes_federais: Decimal = ZERO
@@ -4,7 +4,20 @@ Módulo de parsers para NF-Scanner-Core.
 Este módulo contém os parsers para diferentes tipos de documentos fiscais.
 """
 
-from nf_scanner_core.parsers.nfse_parser import NFSeParser
-from nf_scanner_core.parsers.ai_nfse_parser import AINFSeParser
+from importlib import import_module
+
+# Os parsers são importados sob demanda: o parser por IA carrega o SDK anthropic, que
+# não é necessário para quem usa apenas o parser por expressões regulares
+_LAZY_IMPORTS = {
+    "NFSeParser": "nf_scanner_core.parsers.nfse_parser",
+    "AINFSeParser": "nf_scanner_core.parsers.ai_nfse_parser",
+}
 
 __all__ = ["NFSeParser", "AINFSeParser"]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
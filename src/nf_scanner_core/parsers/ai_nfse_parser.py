@@ -5,9 +5,12 @@ Este módulo utiliza a API do Claude para converter texto de NFSe em um objeto e
 """
 
 import json
+import time
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 
 import anthropic
 
@@ -20,19 +23,76 @@ from nf_scanner_core.models import (
     TributosFederais,
     Valores,
 )
+from nf_scanner_core.models.constantes import ZERO
 from nf_scanner_core.utils.config import (
     get_ai_api_key,
     get_ai_model,
     get_ai_model_alias,
+    get_ai_max_tokens,
 )
+from nf_scanner_core.utils.ai_client import get_ai_client
 from nf_scanner_core.utils.ai_prompts import (
     NFSE_STRUCTURED_DATA_PROMPT,
+    NFSE_STRUCTURED_DATA_SYSTEM,
     STRUCTURED_TEXT_USER_TEXT,
 )
+from nf_scanner_core.utils.cache import (
+    cache_clear,
+    cache_get,
+    cache_set,
+    make_cache_key,
+)
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
+# Campos monetários do JSON retornado pelo Claude, com os mesmos nomes dos modelos
+_CAMPOS_VALORES = (
+    "valor_servicos",
+    "desconto",
+    "valor_liquido",
+    "base_calculo",
+    "aliquota",
+    "valor_iss",
+    "outras_retencoes",
+    "retencoes_federais",
+)
+_CAMPOS_TRIBUTOS = ("pis", "cofins", "ir", "inss", "csll")
+
+# Respostas já obtidas do Claude são reutilizadas para textos idênticos (ex: notas
+# reenviadas); a versão do prompt invalida o cache quando as instruções mudam
+_CACHE_NAMESPACE = "ai_text"
+_PROMPT_VERSION = make_cache_key(NFSE_STRUCTURED_DATA_PROMPT, STRUCTURED_TEXT_USER_TEXT)
+
+# Decodificador reutilizado para ler o objeto JSON da resposta do modelo
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _para_decimal(valor: Any) -> Decimal:
+    """
+    Converte um valor do JSON retornado pelo Claude para Decimal.
+
+    Valores ausentes ou vazios viram o zero compartilhado; textos e inteiros são
+    convertidos diretamente, e apenas floats passam por str, para preservar a
+    representação decimal (Decimal(0.1) traria o erro de ponto flutuante). Textos no
+    formato brasileiro (ex: "1.500,00") também são aceitos.
+
+    Raises:
+        AIParseError: Se o valor não for um número válido
+    """
+    if not valor:
+        return ZERO
+    if isinstance(valor, Decimal):
+        return valor
+    if isinstance(valor, float):
+        return Decimal(str(valor))
+    if isinstance(valor, str) and "," in valor:
+        valor = valor.replace(".", "").replace(",", ".")
+    try:
+        return Decimal(valor)
+    except (InvalidOperation, TypeError, ValueError):
+        raise AIParseError(f"Valor numérico inválido na resposta do Claude: {valor!r}")
+
 
 class AIParseError(Exception):
     """Exceção específica para ser lançada quando ocorre um erro no parsing AI."""
@@ -45,6 +105,141 @@ class AINFSeParser:
     Classe responsável por parsear texto de NFSe usando o Claude.
     """
 
+    @staticmethod
+    def _carregar_json(content: str) -> Dict[str, Any]:
+        """
+        Lê o objeto JSON da resposta do Claude.
+
+        A decodificação começa na primeira chave de abertura e para no fim do objeto,
+        ignorando cercas de bloco de código markdown (```json) ou texto ao redor.
+
+        Args:
+            content: Texto retornado pelo modelo
+
+        Returns:
+            Dict com o objeto JSON da resposta
+
+        Raises:
+            json.JSONDecodeError: Se a resposta não contiver um objeto JSON válido
+        """
+        inicio = content.find("{")
+        if inicio == -1:
+            raise json.JSONDecodeError("Nenhum objeto JSON encontrado", content, 0)
+
+        result, _ = _JSON_DECODER.raw_decode(content, inicio)
+        return result
+
+    @staticmethod
+    def _build_request(texto: str) -> Dict[str, Any]:
+        """
+        Monta os parâmetros da chamada à API de mensagens para o texto da NFSe.
+
+        Args:
+            texto: Texto da NFSe a ser processado
+
+        Returns:
+            Dict com os parâmetros de `messages.create`
+        """
+        # Construindo mensagem para o modelo
+        user_prompt = f"""
+            {STRUCTURED_TEXT_USER_TEXT}
+            
+            {texto}
+            """
+
+        return {
+            "model": get_ai_model(),
+            "max_tokens": get_ai_max_tokens(),
+            # Prompt de sistema estático marcado para o cache de prompts da API
+            "system": NFSE_STRUCTURED_DATA_SYSTEM,
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
+
+    @staticmethod
+    def _ler_resposta(response: Any) -> Dict[str, Any]:
+        """
+        Lê os dados estruturados de uma resposta da API de mensagens.
+
+        Args:
+            response: Mensagem retornada pelo Claude
+
+        Returns:
+            Dict com os dados estruturados da NFSe
+
+        Raises:
+            AIParseError: Se a resposta não contiver um JSON válido ou tiver sido
+                truncada pelo limite de tokens
+        """
+        # Registra o aproveitamento do cache de prompts, para acompanhar a taxa de acerto
+        usage = response.usage
+        logger.debug(
+            "Cache de prompts: %s tokens lidos, %s tokens gravados",
+            getattr(usage, "cache_read_input_tokens", None),
+            getattr(usage, "cache_creation_input_tokens", None),
+        )
+
+        # Um JSON truncado nunca seria válido; a falha é informada com a causa real
+        if response.stop_reason == "max_tokens":
+            raise AIParseError(
+                "Resposta do Claude truncada pelo limite de tokens de saída. "
+                "Aumente NF_SCANNER_AI_MAX_TOKENS"
+            )
+
+        # Faz o parsing do JSON
+        try:
+            return AINFSeParser._carregar_json(response.content[0].text)
+        except json.JSONDecodeError as e:
+            raise AIParseError(
+                f"Erro ao fazer o parsing do JSON retornado pelo Claude: {str(e)}"
+            )
+
+    @staticmethod
+    def _obter_api_key() -> str:
+        """
+        Obtém a chave de API do Claude configurada.
+
+        Returns:
+            str: Chave de API
+
+        Raises:
+            AIParseError: Se a chave não estiver configurada
+        """
+        api_key = get_ai_api_key()
+        if not api_key:
+            raise AIParseError(
+                "Chave de API do Claude não configurada. Configure CLAUDE_API_KEY no arquivo .env"
+            )
+        return api_key
+
+    @staticmethod
+    def _load_cached(
+        texto: str, use_cache: bool
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Consulta o cache de respostas para o texto.
+
+        Args:
+            texto: Texto da NFSe
+            use_cache: Se False, o cache não é consultado
+
+        Returns:
+            Tupla com a chave do cache (None se o cache estiver desabilitado) e a
+            resposta armazenada (None se não houver)
+        """
+        if not use_cache:
+            return None, None
+
+        cache_key = make_cache_key(texto, get_ai_model(), _PROMPT_VERSION)
+        result = cache_get(_CACHE_NAMESPACE, cache_key)
+        if result is not None:
+            logger.info("Dados estruturados do texto obtidos do cache")
+        return cache_key, result
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Remove todas as respostas do Claude armazenadas em cache pelo parser."""
+        cache_clear(_CACHE_NAMESPACE)
+
     @staticmethod
     def _process_with_claude(texto: str) -> Dict[str, Any]:
         """
@@ -59,146 +254,179 @@ class AINFSeParser:
         Raises:
             AIParseError: Se ocorrer um erro na API ou no processamento
         """
-        api_key = get_ai_api_key()
-        model = get_ai_model()
+        api_key = AINFSeParser._obter_api_key()
         model_alias = get_ai_model_alias()
 
-        if not api_key:
+        try:
+            client = get_ai_client(api_key)
+
+            logger.info(
+                "Enviando texto de NFSe para processamento com Claude %s", model_alias
+            )
+
+            response = client.messages.create(**AINFSeParser._build_request(texto))
+
+            result = AINFSeParser._ler_resposta(response)
+            logger.info("Parsing com Claude concluído com sucesso")
+            return result
+
+        except anthropic.APIError as e:
+            raise AIParseError(f"Erro na API do Claude: {str(e)}")
+        except AIParseError:
+            raise
+        except Exception as e:
             raise AIParseError(
-                "Chave de API do Claude não configurada. Configure CLAUDE_API_KEY no arquivo .env"
+                f"Erro desconhecido no processamento com Claude: {str(e)}"
             )
 
-        try:
-            client = anthropic.Anthropic(api_key=api_key)
+    @staticmethod
+    async def _process_with_claude_async(
+        texto: str, client: anthropic.AsyncAnthropic
+    ) -> Dict[str, Any]:
+        """
+        Versão assíncrona de `_process_with_claude`.
 
-            system_prompt = NFSE_STRUCTURED_DATA_PROMPT
+        Args:
+            texto: Texto da NFSe a ser processado
+            client: Cliente assíncrono da API Anthropic
 
-            # Construindo mensagem para o modelo
-            user_prompt = f"""
-            {STRUCTURED_TEXT_USER_TEXT}
-            
-            {texto}
-            """
+        Returns:
+            Dict com os dados estruturados da NFSe
 
+        Raises:
+            AIParseError: Se ocorrer um erro na API ou no processamento
+        """
+        try:
             logger.info(
-                f"Enviando texto de NFSe para processamento com Claude {model_alias}"
+                "Enviando texto de NFSe para processamento com Claude %s",
+                get_ai_model_alias(),
             )
 
-            response = client.messages.create(
-                model=model,
-                max_tokens=4000,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
+            response = await client.messages.create(
+                **AINFSeParser._build_request(texto)
             )
 
-            content = response.content[0].text
-            content = content.replace("```json", "").replace("```", "").strip()
-
-            # Faz o parsing do JSON
-            try:
-                result = json.loads(content)
-                logger.info("Parsing com Claude concluído com sucesso")
-                return result
-            except json.JSONDecodeError as e:
-                raise AIParseError(
-                    f"Erro ao fazer o parsing do JSON retornado pelo Claude: {str(e)}"
-                )
+            result = AINFSeParser._ler_resposta(response)
+            logger.info("Parsing com Claude concluído com sucesso")
+            return result
 
         except anthropic.APIError as e:
             raise AIParseError(f"Erro na API do Claude: {str(e)}")
+        except AIParseError:
+            raise
         except Exception as e:
             raise AIParseError(
                 f"Erro desconhecido no processamento com Claude: {str(e)}"
             )
 
     @staticmethod
-    def _converter_para_modelos(dados_json: Dict[str, Any]) -> NFSe:
+    def _parse_date(date_str: Any) -> Optional[datetime]:
         """
-        Converte os dados JSON retornados pelo Claude para a model de NFSe.
+        Converte uma data no formato ISO 8601 retornada pelo Claude.
 
         Args:
-            dados_json: Dicionário com os dados extraídos pelo Claude
+            date_str: Data em texto (ex: "2025-01-01T09:00:00")
 
         Returns:
-            NFSe: Objeto NFSe preenchido com os dados
+            Optional[datetime]: Data convertida ou None se ausente ou inválida
         """
+        if not date_str:
+            return None
+        try:
+            return datetime.fromisoformat(date_str)
+        except (ValueError, TypeError):
+            return None
 
-        # Função auxiliar para converter datas
-        def parse_date(date_str):
-            if not date_str:
-                return datetime.now()
-            try:
-                return datetime.fromisoformat(date_str)
-            except (ValueError, TypeError):
-                return datetime.now()
-
-        # Criando objetos de endereço
-        prestador_endereco = None
-        if "endereco" in dados_json.get("prestador", {}):
-            e = dados_json["prestador"]["endereco"]
-            prestador_endereco = Endereco(
-                logradouro=e.get("logradouro") or "",
-                numero=e.get("numero") or "",
-                bairro=e.get("bairro"),
-                cep=e.get("cep"),
-                municipio=e.get("municipio"),
-                uf=e.get("uf"),
-            )
+    @staticmethod
+    def _build_endereco(dados_empresa: Dict[str, Any]) -> Optional[Endereco]:
+        """
+        Cria o endereço de uma empresa a partir do JSON retornado pelo Claude.
 
-        tomador_endereco = None
-        if "endereco" in dados_json.get("tomador", {}):
-            e = dados_json["tomador"]["endereco"]
-            tomador_endereco = Endereco(
-                logradouro=e.get("logradouro") or "",
-                numero=e.get("numero") or "",
-                bairro=e.get("bairro"),
-                cep=e.get("cep"),
-                municipio=e.get("municipio"),
-                uf=e.get("uf"),
-            )
+        Args:
+            dados_empresa: Dados do prestador ou do tomador
 
-        # Criando objetos de contato
-        prestador_contato = None
-        if "contato" in dados_json.get("prestador", {}):
-            c = dados_json["prestador"]["contato"]
-            if c and (c.get("telefone") or c.get("email")):
-                prestador_contato = Contato(
-                    telefone=c.get("telefone"), email=c.get("email")
-                )
+        Returns:
+            Optional[Endereco]: Endereço da empresa ou None se não informado
+        """
+        e = dados_empresa.get("endereco")
+        if not e:
+            return None
+
+        return Endereco(
+            logradouro=e.get("logradouro") or "",
+            numero=e.get("numero") or "",
+            bairro=e.get("bairro"),
+            cep=e.get("cep"),
+            municipio=e.get("municipio"),
+            uf=e.get("uf"),
+        )
 
-        tomador_contato = None
-        if "contato" in dados_json.get("tomador", {}):
-            c = dados_json["tomador"]["contato"]
-            if c and (c.get("telefone") or c.get("email")):
-                tomador_contato = Contato(
-                    telefone=c.get("telefone"), email=c.get("email")
-                )
+    @staticmethod
+    def _build_contato(dados_empresa: Dict[str, Any]) -> Optional[Contato]:
+        """
+        Cria o contato de uma empresa a partir do JSON retornado pelo Claude.
 
-        # Criando objetos de empresa
-        prestador = dados_json.get("prestador", {})
-        prestador_obj = Empresa(
-            razao_social=prestador.get("razao_social") or "N/A",
-            cnpj=prestador.get("cnpj") or "N/A",
-            inscricao_municipal=prestador.get("inscricao_municipal"),
-            inscricao_estadual=prestador.get("inscricao_estadual"),
-            nome_fantasia=prestador.get("nome_fantasia"),
-            endereco=prestador_endereco,
-            contato=prestador_contato,
+        Args:
+            dados_empresa: Dados do prestador ou do tomador
+
+        Returns:
+            Optional[Contato]: Contato da empresa ou None se não houver telefone nem email
+        """
+        c = dados_empresa.get("contato")
+        if not c or not (c.get("telefone") or c.get("email")):
+            return None
+
+        return Contato(telefone=c.get("telefone"), email=c.get("email"))
+
+    @staticmethod
+    def _build_empresa(dados_empresa: Dict[str, Any]) -> Empresa:
+        """
+        Cria o prestador ou o tomador a partir do JSON retornado pelo Claude.
+
+        Args:
+            dados_empresa: Dados do prestador ou do tomador
+
+        Returns:
+            Empresa: Empresa preenchida, com "N/A" nos campos obrigatórios ausentes
+        """
+        return Empresa(
+            razao_social=dados_empresa.get("razao_social") or "N/A",
+            cnpj=dados_empresa.get("cnpj") or "N/A",
+            inscricao_municipal=dados_empresa.get("inscricao_municipal"),
+            inscricao_estadual=dados_empresa.get("inscricao_estadual"),
+            nome_fantasia=dados_empresa.get("nome_fantasia"),
+            endereco=AINFSeParser._build_endereco(dados_empresa),
+            contato=AINFSeParser._build_contato(dados_empresa),
         )
 
-        tomador = dados_json.get("tomador", {})
-        tomador_obj = Empresa(
-            razao_social=tomador.get("razao_social") or "N/A",
-            cnpj=tomador.get("cnpj") or "N/A",
-            inscricao_municipal=tomador.get("inscricao_municipal"),
-            inscricao_estadual=tomador.get("inscricao_estadual"),
-            nome_fantasia=tomador.get("nome_fantasia"),
-            endereco=tomador_endereco,
-            contato=tomador_contato,
+    @staticmethod
+    def _converter_para_modelos(dados_json: Dict[str, Any]) -> NFSe:
+        """
+        Converte os dados JSON retornados pelo Claude para a model de NFSe.
+
+        Args:
+            dados_json: Dicionário com os dados extraídos pelo Claude
+
+        Returns:
+            NFSe: Objeto NFSe preenchido com os dados
+
+        Raises:
+            AIParseError: Se a data/hora de emissão estiver ausente ou for inválida
+        """
+        data_hora_emissao = AINFSeParser._parse_date(
+            dados_json.get("data_hora_emissao")
         )
+        if data_hora_emissao is None:
+            raise AIParseError(
+                "Data/hora de emissão ausente ou inválida na resposta do Claude"
+            )
+
+        # Criando objetos de empresa
+        prestador_obj = AINFSeParser._build_empresa(dados_json.get("prestador") or {})
+        tomador_obj = AINFSeParser._build_empresa(dados_json.get("tomador") or {})
 
         # Criando objeto de serviço
-        servico = dados_json.get("servico", {})
+        servico = dados_json.get("servico") or {}
         servico_obj = ServicoDetalhe(
             descricao=servico.get("descricao") or "N/A",
             codigo_servico=servico.get("codigo_servico"),
@@ -208,36 +436,23 @@ class AINFSeParser:
             observacoes=servico.get("observacoes"),
         )
 
-        # Criando objeto de valores
-        valores = dados_json.get("valores", {})
-        from decimal import Decimal
-
+        # Criando objetos de valores e de tributos, campo a campo conforme as tabelas
+        valores = dados_json.get("valores") or {}
         valores_obj = Valores(
-            valor_servicos=Decimal(str(valores.get("valor_servicos") or "0.0")),
-            desconto=Decimal(str(valores.get("desconto") or "0.0")),
-            valor_liquido=Decimal(str(valores.get("valor_liquido") or "0.0")),
-            base_calculo=Decimal(str(valores.get("base_calculo") or "0.0")),
-            aliquota=Decimal(str(valores.get("aliquota") or "0.0")),
-            valor_iss=Decimal(str(valores.get("valor_iss") or "0.0")),
-            outras_retencoes=Decimal(str(valores.get("outras_retencoes") or "0.0")),
-            retencoes_federais=Decimal(str(valores.get("retencoes_federais") or "0.0")),
+            **{campo: _para_decimal(valores.get(campo)) for campo in _CAMPOS_VALORES}
         )
 
-        # Criando objeto de tributos
-        tributos = dados_json.get("tributos_federais", {})
+        tributos = dados_json.get("tributos_federais") or {}
         tributos_obj = TributosFederais(
-            pis=Decimal(str(tributos.get("pis") or "0.0")),
-            cofins=Decimal(str(tributos.get("cofins") or "0.0")),
-            ir=Decimal(str(tributos.get("ir") or "0.0")),
-            inss=Decimal(str(tributos.get("inss") or "0.0")),
-            csll=Decimal(str(tributos.get("csll") or "0.0")),
+            **{campo: _para_decimal(tributos.get(campo)) for campo in _CAMPOS_TRIBUTOS}
         )
 
         # Criando o objeto NFSe
         nfse = NFSe(
-            data_hora_emissao=parse_date(dados_json.get("data_hora_emissao")),
+            data_hora_emissao=data_hora_emissao,
+            # Sem competência informada, usa o mês da emissão (e não a data atual)
             competencia=dados_json.get("competencia")
-            or datetime.now().strftime("%m/%Y"),
+            or data_hora_emissao.strftime("%m/%Y"),
             codigo_verificacao=dados_json.get("codigo_verificacao") or "N/A",
             numero_rps=dados_json.get("numero_rps") or "N/A",
             local_prestacao=dados_json.get("local_prestacao") or "N/A",
@@ -255,12 +470,13 @@ class AINFSeParser:
         return nfse
 
     @classmethod
-    def parse(cls, texto: str) -> NFSe:
+    def parse(cls, texto: str, use_cache: bool = True) -> NFSe:
         """
         Extrai dados estruturados de um texto de NFSe usando a IA.
 
         Args:
             texto: Texto da NFSe a ser analisado
+            use_cache: Se True, reutiliza a resposta em cache de um texto idêntico
 
         Returns:
             NFSe: Objeto NFSe com os dados extraídos
@@ -269,19 +485,210 @@ class AINFSeParser:
             AIParseError: Se houver falha na extração de dados
         """
         try:
-            # Processa o texto com Claude
-            dados_json = cls._process_with_claude(texto)
+            cache_key, dados_json = cls._load_cached(texto, use_cache)
+            if dados_json is None:
+                # Processa o texto com Claude
+                dados_json = cls._process_with_claude(texto)
 
             # Converte os dados para os modelos do sistema
             nfse = cls._converter_para_modelos(dados_json)
 
+            # Armazena apenas respostas que resultaram em uma NFSe válida
+            if cache_key:
+                cache_set(_CACHE_NAMESPACE, cache_key, dados_json)
+
             return nfse
 
         except AIParseError as e:
             # Loga o erro e repassa a exceção
-            logger.error(f"Erro no parsing com IA: {str(e)}")
+            logger.error("Erro no parsing com IA: %s", e)
             raise e
         except Exception as e:
             # Loga qualquer outro erro e levanta uma exceção mais genérica
-            logger.error(f"Erro inesperado no parsing com IA: {str(e)}")
+            logger.error("Erro inesperado no parsing com IA: %s", e)
+            raise AIParseError(f"Erro inesperado ao processar o texto: {str(e)}")
+
+    @classmethod
+    async def parse_async(
+        cls,
+        texto: str,
+        client: Optional[anthropic.AsyncAnthropic] = None,
+        use_cache: bool = True,
+    ) -> NFSe:
+        """
+        Extrai dados estruturados de um texto de NFSe usando a IA, de forma assíncrona.
+
+        Args:
+            texto: Texto da NFSe a ser analisado
+            client: Cliente assíncrono da API Anthropic a ser reutilizado. Se não for
+                informado, um cliente é criado e fechado ao final da chamada.
+            use_cache: Se True, reutiliza a resposta em cache de um texto idêntico
+
+        Returns:
+            NFSe: Objeto NFSe com os dados extraídos
+
+        Raises:
+            AIParseError: Se houver falha na extração de dados
+        """
+        try:
+            cache_key, dados_json = await asyncio.to_thread(
+                cls._load_cached, texto, use_cache
+            )
+            if dados_json is None and client is not None:
+                dados_json = await cls._process_with_claude_async(texto, client)
+            elif dados_json is None:
+                async with anthropic.AsyncAnthropic(
+                    api_key=cls._obter_api_key()
+                ) as client:
+                    dados_json = await cls._process_with_claude_async(texto, client)
+
+            nfse = cls._converter_para_modelos(dados_json)
+
+            if cache_key:
+                await asyncio.to_thread(
+                    cache_set, _CACHE_NAMESPACE, cache_key, dados_json
+                )
+
+            return nfse
+
+        except AIParseError as e:
+            logger.error("Erro no parsing com IA: %s", e)
+            raise e
+        except Exception as e:
+            logger.error("Erro inesperado no parsing com IA: %s", e)
             raise AIParseError(f"Erro inesperado ao processar o texto: {str(e)}")
+
+    @classmethod
+    async def parse_many_async(
+        cls, textos: Iterable[str], max_concurrency: int = 5, use_cache: bool = True
+    ) -> List[Union[NFSe, Exception]]:
+        """
+        Extrai dados de vários textos de NFSe com chamadas concorrentes à API.
+
+        As chamadas compartilham um único cliente assíncrono e são feitas em paralelo,
+        até `max_concurrency` ao mesmo tempo para respeitar os limites de taxa do
+        provedor. Uma falha em um texto não interrompe os demais.
+
+        Args:
+            textos: Textos das NFSe a serem analisados
+            max_concurrency: Número máximo de requisições simultâneas
+            use_cache: Se True, reutiliza respostas em cache de textos idênticos
+
+        Returns:
+            List com o objeto NFSe de cada texto, na ordem informada, ou a exceção
+            lançada no parsing daquele texto
+
+        Raises:
+            AIParseError: Se a chave de API não estiver configurada
+        """
+        semaforo = asyncio.Semaphore(max_concurrency)
+
+        async with anthropic.AsyncAnthropic(api_key=cls._obter_api_key()) as client:
+
+            async def analisar(texto: str) -> NFSe:
+                async with semaforo:
+                    return await cls.parse_async(texto, client, use_cache)
+
+            return await asyncio.gather(
+                *(analisar(texto) for texto in textos), return_exceptions=True
+            )
+
+    @classmethod
+    def parse_batch(
+        cls, textos: Iterable[str], poll_interval: float = 30.0, use_cache: bool = True
+    ) -> List[Union[NFSe, AIParseError]]:
+        """
+        Extrai dados de vários textos de NFSe em um único lote da API de Message Batches.
+
+        O lote é processado de forma assíncrona pela Anthropic, com custo reduzido em
+        relação às chamadas individuais, em troca de uma latência maior (até 24 horas).
+        Indicado para processamentos em massa que não precisam de resposta imediata.
+        Uma falha em um texto não interrompe os demais.
+
+        Args:
+            textos: Textos das NFSe a serem analisados
+            poll_interval: Intervalo, em segundos, entre as consultas ao estado do lote
+            use_cache: Se True, textos com resposta em cache não são enviados no lote
+
+        Returns:
+            List com o objeto NFSe de cada texto, na ordem informada, ou o AIParseError
+            correspondente à falha daquele texto
+
+        Raises:
+            AIParseError: Se a chave de API não estiver configurada ou o lote não puder
+                ser criado ou consultado
+        """
+        textos = list(textos)
+        # Uma exceção por posição, para não compartilhar traceback entre resultados
+        resultados: List[Union[NFSe, AIParseError]] = [
+            AIParseError("Texto sem resultado no lote") for _ in textos
+        ]
+
+        # Resolve pelo cache o que for possível; só os demais textos vão para o lote
+        chaves: List[Optional[str]] = []
+        pendentes: List[int] = []
+        for indice, texto in enumerate(textos):
+            cache_key, dados_json = cls._load_cached(texto, use_cache)
+            chaves.append(cache_key)
+            if dados_json is None:
+                pendentes.append(indice)
+                continue
+            try:
+                resultados[indice] = cls._converter_para_modelos(dados_json)
+            except AIParseError as e:
+                resultados[indice] = e
+            except Exception as e:
+                resultados[indice] = AIParseError(
+                    f"Erro inesperado ao processar o texto: {str(e)}"
+                )
+
+        if not pendentes:
+            return resultados
+
+        api_key = cls._obter_api_key()
+
+        try:
+            client = get_ai_client(api_key)
+
+            # O índice de cada texto identifica a requisição correspondente no lote
+            batch = client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": str(indice),
+                        "params": cls._build_request(textos[indice]),
+                    }
+                    for indice in pendentes
+                ]
+            )
+            logger.info(
+                "Lote %s criado com %d textos de NFSe", batch.id, len(pendentes)
+            )
+
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = client.messages.batches.retrieve(batch.id)
+
+            for item in client.messages.batches.results(batch.id):
+                indice = int(item.custom_id)
+                if item.result.type != "succeeded":
+                    resultados[indice] = AIParseError(
+                        f"Requisição do lote não concluída: {item.result.type}"
+                    )
+                    continue
+
+                try:
+                    dados_json = cls._ler_resposta(item.result.message)
+                    resultados[indice] = cls._converter_para_modelos(dados_json)
+                    if chaves[indice]:
+                        cache_set(_CACHE_NAMESPACE, chaves[indice], dados_json)
+                except AIParseError as e:
+                    resultados[indice] = e
+                except Exception as e:
+                    resultados[indice] = AIParseError(
+                        f"Erro inesperado ao processar o texto: {str(e)}"
+                    )
+
+            return resultados
+
+        except anthropic.APIError as e:
+            raise AIParseError(f"Erro na API do Claude: {str(e)}")
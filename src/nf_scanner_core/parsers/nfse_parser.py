@@ -4,6 +4,7 @@ Converte o texto extraído do PDF para o modelo de dados NFSe.
 """
 
 import re
+from functools import lru_cache
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional, Dict, Any, Tuple, Union
@@ -17,6 +18,126 @@ from nf_scanner_core.models import (
     TributosFederais,
     Valores,
 )
+from nf_scanner_core.models.constantes import ZERO
+
+
+# Caracteres invisíveis de largura zero (o pymupdf emite \u200b) removidos na limpeza.
+# str.replace em sequência é bem mais rápido que str.translate com tabela em dict,
+# que cai no caminho lento (uma consulta ao dict por caractere) em texto com acentos
+_CARACTERES_INVISIVEIS = ("\u200b", "\u200c", "\u200d", "\ufeff")
+
+# Padrões pré-compilados no import do módulo (evita recompilar a cada chamada)
+_RE_NAO_DIGITO_VIRGULA = re.compile(r"[^\d,]")
+_RE_NAO_DIGITO = re.compile(r"[^\d]")
+_RE_PORCENTAGEM = re.compile(r"(\d+(?:[,.]\d+)?)")
+_RE_DATAS = (
+    re.compile(r"(\d{2}/\d{2}/\d{4} \d{2}:\d{2})"),  # 01/01/2025 09:00
+    re.compile(r"(\d{2}/\d{2}/\d{4})"),  # 01/01/2025
+)
+_RE_CNPJ = re.compile(r"(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})")  # 12.345.678/0001-90
+_RE_CPF = re.compile(r"(\d{3}\.\d{3}\.\d{3}-\d{2})")  # 123.456.789-00
+
+# Endereço
+_RE_MUNICIPIO = re.compile(r"Município:?\s*([^/]+)\s*/\s*([A-Z]{2})")
+_RE_ENDERECO = re.compile(r"Endereço:?\s*(.*?)(?=$|Telefone|Email)")
+_RE_LOGRADOURO_NUMERO = re.compile(r"(.*?),?\s*(\d+)")
+_RE_BAIRRO = re.compile(r"-\s*([^-]*?)\s*-")
+_RE_CEP = re.compile(r"CEP:?\s*(\d{5}-\d{3}|\d{8})")
+
+# Empresa
+# Seções delimitadas por rótulos literais: (início, fins possíveis)
+_SECOES_EMPRESA = {
+    "prestador": ("Dados do Prestador", ("Dados do Tomador",)),
+    "tomador": ("Dados do Tomador", ("Discriminação dos Serviços",)),
+}
+_RE_INSCRICAO_ESTADUAL = re.compile(r"Inscrição Estadual:\s*([^\s]+)")
+_RE_EMAIL_CANDIDATO = re.compile(r"[\w\.-]+@[\w\.-]+\.\w{2,}")
+
+# Serviço
+_SECAO_SERVICO = (
+    "Discriminação dos Serviços",
+    ("Tributos Federais", "Detalhamento de Valores"),
+)
+_RE_DESCRICAO_SERVICO = re.compile(
+    r"Discriminação dos Serviços\s+(.*?)(?=Código do Serviço|CNAE|$)", re.DOTALL
+)
+_RE_CODIGO_ATIVIDADE = re.compile(
+    r"Código do Serviço.*?:\s*([^-]+)\s*-\s*(.*?)(?=CNAE|$)", re.DOTALL
+)
+_RE_CNAE = re.compile(r"CNAE:\s*([^-]+)\s*-\s*(.*?)(?=Detalhamento|$)", re.DOTALL)
+_SECAO_OBSERVACOES = ("Detalhamento Específico", ("Tributos Federais",))
+
+# Tributos e valores
+_SECAO_TRIBUTOS_FEDERAIS = ("Tributos Federais", ("Detalhamento de Valores",))
+_RE_TRIBUTO = re.compile(r"\b(PIS|COFINS|IR|INSS|CSLL)\s*R\$\s*([\d,.]+)")
+# Cada campo "(?>.*?Rótulo:\s*R\$\s*(valor))" fica em um grupo atômico: o ".*?" ainda
+# avança até a primeira ocorrência do rótulo seguida de um valor (pulando rótulos
+# repetidos ou malformados), mas, uma vez casado, o campo não é mais revisitado. Assim,
+# quando falta um rótulo, a busca falha em tempo linear, sem o backtracking
+# combinatório entre os vários ".*?" (grupos atômicos: Python 3.11+)
+_RE_VALORES = re.compile(
+    r"Detalhamento de Valores(?>.*?Valor dos Serviços:\s*R\$\s*([\d,.]+))(?>.*?Desconto:\s*R\$\s*([\d,.]+))(?>.*?Valor Líquido:\s*R\$\s*([\d,.]+))(?>.*?Base de Cálculo:\s*R\$\s*([\d,.]+))(?>.*?Alíquota:\s*([\d,.%]+))(?>.*?Valor ISS:\s*R\$\s*([\d,.]+))",
+    re.DOTALL,
+)
+_RE_RETENCOES = re.compile(
+    r"Outras Retenções:\s*R\$\s*([\d,.]+)(?>.*?Retenções Federais:\s*R\$\s*([\d,.]+))",
+    re.DOTALL,
+)
+
+# Cabeçalho
+_RE_PREFEITURA = re.compile(
+    r"PREFEITURA MUNICIPAL DE\s*(.*?)(?=SECRETARIA|DIRETORIA|Número|$)", re.IGNORECASE
+)
+_RE_SECRETARIA = re.compile(
+    r"SECRETARIA\s*MUNICIPAL DE\s*(.*?)(?=DIRETORIA|Número|$)", re.IGNORECASE
+)
+_RE_NUMERO_NFSE = re.compile(r"Número da NFS-e\s*(\d+)")
+_RE_EMISSAO = re.compile(r"Data/Hora Emissão:\s*(.*?)(?=Competência|$)")
+_RE_COMPETENCIA = re.compile(r"Competência:\s*(.*?)(?=Código|$)")
+_RE_CODIGO_VERIFICACAO = re.compile(
+    r"Código de Verificação:\s*(.*?)(?=Número do RPS|$)"
+)
+_RE_NUMERO_RPS = re.compile(r"Número do RPS:\s*(.*?)(?=Nº NFSe Substituída|$)")
+_RE_NFSE_SUBSTITUIDA = re.compile(
+    r"Nº NFSe Substituída:\s*(.*?)(?=Local da Prestação|$)"
+)
+_RE_LOCAL_PRESTACAO = re.compile(r"Local da Prestação:\s*(.*?)(?=Dados do Prestador|$)")
+
+
+def _fatiar_secao(texto: str, inicio: str, fins: Tuple[str, ...]) -> Optional[str]:
+    """
+    Recorta a seção que começa em um rótulo literal e vai até o primeiro rótulo de fim.
+
+    Usa str.find em vez de regex com '.*?' e re.DOTALL, evitando o backtracking
+    sobre seções longas.
+
+    Args:
+        texto: Texto onde procurar a seção
+        inicio: Rótulo que abre a seção (incluído no recorte)
+        fins: Rótulos que encerram a seção; sem nenhum deles, vai até o fim do texto
+
+    Returns:
+        Optional[str]: Seção recortada, ou None se o rótulo de início não existir
+    """
+    pos_inicio = texto.find(inicio)
+    if pos_inicio == -1:
+        return None
+
+    pos_busca = pos_inicio + len(inicio)
+    pos_fim = len(texto)
+    for fim in fins:
+        pos = texto.find(fim, pos_busca, pos_fim)
+        if pos != -1:
+            pos_fim = pos
+    return texto[pos_inicio:pos_fim]
+
+
+@lru_cache(maxsize=64)
+def _padrao_rotulo(rotulo: str) -> re.Pattern:
+    """Compila (uma única vez por rótulo) o padrão de valor após um rótulo."""
+    return re.compile(
+        rf"{re.escape(rotulo)}[\s:]*([^:]*?)(?:$|(?=\s+[A-Z][a-zA-Z]*:))", re.DOTALL
+    )
 
 
 class NFSeParser:
@@ -39,13 +160,11 @@ class NFSeParser:
             return ""
 
         # Remove caracteres invisíveis (Unicode ZERO WIDTH SPACE - \u200B) <-- Original do pymupdf
-        texto_limpo = texto.replace("\u200b", "")
-
-        # Remove quebras de linha e espaços extras
-        texto_limpo = re.sub(r"\s+", " ", texto_limpo)
-
-        # Remove espaços antes e depois
-        return texto_limpo.strip()
+        # e, em seguida, quebras de linha e espaços extras, inclusive nas pontas; o split
+        # sem argumentos reconhece os mesmos espaços Unicode que o \s das regex
+        for caractere in _CARACTERES_INVISIVEIS:
+            texto = texto.replace(caractere, "")
+        return " ".join(texto.split())
 
     @staticmethod
     def _extrair_valor_moeda(texto: str) -> Decimal:
@@ -53,15 +172,14 @@ class NFSeParser:
         Extrai um valor monetário de um texto.
         Ex: "R$ 1.500,00" -> Decimal('1500.00')
         """
-        texto = NFSeParser._limpar_texto(texto)
-
-        if not texto or texto == "---":
-            return Decimal("0.00")
+        if not texto:
+            return ZERO
 
-        # Remove R$, pontos e substitui vírgula por ponto
-        valor_texto = re.sub(r"[^\d,]", "", texto).replace(",", ".")
+        # Remove R$, pontos, espaços e caracteres invisíveis em uma única passada (um
+        # "---" também fica vazio) e substitui vírgula por ponto
+        valor_texto = _RE_NAO_DIGITO_VIRGULA.sub("", texto).replace(",", ".")
         if not valor_texto:
-            return Decimal("0.00")
+            return ZERO
 
         return Decimal(valor_texto)
 
@@ -74,15 +192,16 @@ class NFSeParser:
         texto = NFSeParser._limpar_texto(texto)
 
         if not texto or texto == "---":
-            return Decimal("0.00")
+            return ZERO
 
         # Extrai apenas os números e pontuações
-        match = re.search(r"(\d+(?:[,.]\d+)?)", texto)
+        match = _RE_PORCENTAGEM.search(texto)
         if not match:
-            return Decimal("0.00")
+            return ZERO
 
+        # scaleb apenas ajusta o expoente, sem passar pela divisão com contexto
         valor = match.group(1).replace(",", ".")
-        return Decimal(valor) / 100
+        return Decimal(valor).scaleb(-2)
 
     @staticmethod
     def _extrair_data_hora(texto: str) -> Optional[datetime]:
@@ -95,13 +214,8 @@ class NFSeParser:
         if not texto or texto == "---":
             return None
 
-        patterns = [
-            r"(\d{2}/\d{2}/\d{4} \d{2}:\d{2})",  # 01/01/2025 09:00
-            r"(\d{2}/\d{2}/\d{4})",  # 01/01/2025
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, texto)
+        for pattern in _RE_DATAS:
+            match = pattern.search(texto)
             if match:
                 data_texto = match.group(1)
                 try:
@@ -125,17 +239,17 @@ class NFSeParser:
             return None
 
         # Padrão CNPJ: 12.345.678/0001-90
-        cnpj_match = re.search(r"(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})", texto)
+        cnpj_match = _RE_CNPJ.search(texto)
         if cnpj_match:
             return cnpj_match.group(1)
 
         # Padrão CPF: 123.456.789-00
-        cpf_match = re.search(r"(\d{3}\.\d{3}\.\d{3}-\d{2})", texto)
+        cpf_match = _RE_CPF.search(texto)
         if cpf_match:
             return cpf_match.group(1)
 
         # Sem formatação
-        nums = re.sub(r"[^\d]", "", texto)
+        nums = _RE_NAO_DIGITO.sub("", texto)
         if len(nums) == 11 or len(nums) == 14:
             return nums
 
@@ -153,16 +267,16 @@ class NFSeParser:
         # ([^:]*?) - Qualquer caractere exceto dois-pontos (não guloso)
         # (?:$|(?=\\s+[A-Z][a-zA-Z]*:)) - Fim da string ou próximo rótulo
         """
+        # A limpeza é barata e torna o helper seguro para texto bruto; com a entrada
+        # limpa, o valor capturado só precisa ter as pontas aparadas
         texto = NFSeParser._limpar_texto(texto)
 
         if not texto:
             return None
 
-        pattern = rf"{rotulo}[\s:]*([^:]*?)(?:$|(?=\s+[A-Z][a-zA-Z]*:))"
-        match = re.search(pattern, texto, re.DOTALL)
+        match = _padrao_rotulo(rotulo).search(texto)
         if match:
-            valor = match.group(1).strip()
-            return NFSeParser._limpar_texto(valor)
+            return match.group(1).strip()
         return None
 
     @classmethod
@@ -180,13 +294,13 @@ class NFSeParser:
         municipio = None
         uf = None
 
-        municipio_match = re.search(r"Município:?\s*([^/]+)\s*/\s*([A-Z]{2})", texto)
+        municipio_match = _RE_MUNICIPIO.search(texto)
         if municipio_match:
             municipio = cls._limpar_texto(municipio_match.group(1))
             uf = municipio_match.group(2)
 
         # Extrai informações do endereço (logradouro, número, bairro, cep)
-        endereco_match = re.search(r"Endereço:?\s*(.*?)(?=$|Telefone|Email)", texto)
+        endereco_match = _RE_ENDERECO.search(texto)
         endereco_texto = ""
 
         if endereco_match:
@@ -195,7 +309,7 @@ class NFSeParser:
             return Endereco(logradouro="", numero="")
 
         # Extrai logradouro e número
-        logradouro_numero = re.search(r"(.*?),?\s*(\d+)", endereco_texto)
+        logradouro_numero = _RE_LOGRADOURO_NUMERO.search(endereco_texto)
         logradouro = ""
         numero = ""
 
@@ -207,13 +321,13 @@ class NFSeParser:
 
         # Extrai bairro
         bairro = None
-        bairro_match = re.search(r"-\s*([^-]*?)\s*-", endereco_texto)
+        bairro_match = _RE_BAIRRO.search(endereco_texto)
         if bairro_match:
             bairro = cls._limpar_texto(bairro_match.group(1))
 
         # Extrai CEP
         cep = None
-        cep_match = re.search(r"CEP:?\s*(\d{5}-\d{3}|\d{8})", texto)
+        cep_match = _RE_CEP.search(texto)
         if cep_match:
             cep = cep_match.group(1)
 
@@ -232,32 +346,24 @@ class NFSeParser:
         Extrai dados de uma empresa (prestador ou tomador) de uma NFSe.
 
         Args:
-            texto: Texto extraído da NFSe
+            texto: Texto extraído da NFSe (limpo ou bruto)
             tipo: Tipo de empresa a extrair ('prestador' ou 'tomador')
 
         Returns:
             Optional[Empresa]: Dados da empresa ou None se não encontrado
         """
-        texto = cls._limpar_texto(texto)
 
         # Configurações específicas para cada tipo de empresa
         if tipo.lower() == "prestador":
-            secao_chave = "Dados do Prestador"
-            secao_fim = "Dados do Tomador"
+            secao_chave, secao_fins = _SECOES_EMPRESA["prestador"]
         else:  # tomador
-            secao_chave = "Dados do Tomador"
-            secao_fim = "Discriminação dos Serviços"
+            secao_chave, secao_fins = _SECOES_EMPRESA["tomador"]
 
-        if secao_chave not in texto:
-            return None
-
-        # Extrai seção da empresa
-        pattern = f"{secao_chave}.*?(?={secao_fim}|$)"
-        match = re.search(pattern, texto, re.DOTALL)
-        if not match:
+        # Extrai seção da empresa e a limpa, caso o texto recebido seja bruto
+        secao_empresa = _fatiar_secao(texto, secao_chave, secao_fins)
+        if secao_empresa is None:
             return None
-
-        secao_empresa = cls._limpar_texto(match.group(0))
+        secao_empresa = cls._limpar_texto(secao_empresa)
 
         # Extrai dados comuns
         razao_social = cls._extrair_valor_apos_chave(secao_empresa, "Razão Social")
@@ -267,8 +373,7 @@ class NFSeParser:
         )
 
         # Melhor extração de inscrição estadual com regex
-        insc_estadual_pattern = r"Inscrição Estadual:\s*([^\s]+)"
-        insc_estadual_match = re.search(insc_estadual_pattern, secao_empresa)
+        insc_estadual_match = _RE_INSCRICAO_ESTADUAL.search(secao_empresa)
         inscricao_estadual = (
             insc_estadual_match.group(1) if insc_estadual_match else None
         )
@@ -280,7 +385,7 @@ class NFSeParser:
                     0
                 ].strip()
             # Extrai apenas os números da inscrição municipal
-            inscricao_municipal = re.sub(r"[^\d]", "", inscricao_municipal)
+            inscricao_municipal = _RE_NAO_DIGITO.sub("", inscricao_municipal)
 
         # Limpa a inscrição estadual
         if inscricao_estadual:
@@ -298,15 +403,14 @@ class NFSeParser:
         telefone = cls._extrair_valor_apos_chave(secao_empresa, "Telefone")
         email_extracted = cls._extrair_valor_apos_chave(secao_empresa, "Email")
 
-        # Usa regex para garantir que apenas um email válido seja mantido
+        # Mantém apenas o primeiro email válido. O candidato já tem um único '@' e
+        # termina em '.xx'; falta só recusar rótulos de domínio vazios ('a@.b.com',
+        # 'a@b..com'), como fazia a antiga regex de validação
         email_limpo = None
         if email_extracted:
-            email_regex = (
-                r"^[\w\-\.]+@([\w-]+\.)+[\w-]{2,}$"  # https://regex101.com/r/lHs2R3/1
-            )
-            possible_emails = re.findall(r"[\w\.-]+@[\w\.-]+\.\w{2,}", email_extracted)
-            for email in possible_emails:
-                if re.match(email_regex, email):
+            for email in _RE_EMAIL_CANDIDATO.findall(email_extracted):
+                dominio = email.partition("@")[2]
+                if not dominio.startswith(".") and ".." not in dominio:
                     email_limpo = email
                     break
 
@@ -341,28 +445,18 @@ class NFSeParser:
     def _extrair_servico(cls, texto: str) -> Optional[ServicoDetalhe]:
         """
         Extrai dados sobre o serviço prestado.
+        A seção recortada é limpa aqui, então o texto pode chegar limpo ou bruto.
         """
-        texto = cls._limpar_texto(texto)
-
-        if "Discriminação dos Serviços" not in texto:
-            return None
 
         # Extrai seção de discriminação de serviços
-        pattern = r"Discriminação dos Serviços.*?(?=Tributos Federais|Detalhamento de Valores|$)"
-        match = re.search(pattern, texto, re.DOTALL)
-        if not match:
+        secao_servico = _fatiar_secao(texto, *_SECAO_SERVICO)
+        if secao_servico is None:
             return None
-
-        secao_servico = match.group(0)
         secao_servico = cls._limpar_texto(secao_servico)
 
         # Extrai descrição do serviço (primeira linha após o título)
         descricao = ""
-        descricao_match = re.search(
-            r"Discriminação dos Serviços\s+(.*?)(?=Código do Serviço|CNAE|$)",
-            secao_servico,
-            re.DOTALL,
-        )
+        descricao_match = _RE_DESCRICAO_SERVICO.search(secao_servico)
         if descricao_match:
             descricao = cls._limpar_texto(descricao_match.group(1))
 
@@ -370,11 +464,7 @@ class NFSeParser:
         codigo_servico = None
         atividade_descricao = None
 
-        codigo_atividade_match = re.search(
-            r"Código do Serviço.*?:\s*([^-]+)\s*-\s*(.*?)(?=CNAE|$)",
-            secao_servico,
-            re.DOTALL,
-        )
+        codigo_atividade_match = _RE_CODIGO_ATIVIDADE.search(secao_servico)
         if codigo_atividade_match:
             codigo_servico = cls._limpar_texto(codigo_atividade_match.group(1))
             atividade_descricao = cls._limpar_texto(codigo_atividade_match.group(2))
@@ -384,22 +474,16 @@ class NFSeParser:
         cnae_descricao = None
 
         # Extrai CNAE (grupo 1) e descrição (grupo 2)
-        cnae_match = re.search(
-            r"CNAE:\s*([^-]+)\s*-\s*(.*?)(?=Detalhamento|$)", secao_servico, re.DOTALL
-        )
+        cnae_match = _RE_CNAE.search(secao_servico)
         if cnae_match:
             cnae = cls._limpar_texto(cnae_match.group(1))
             cnae_descricao = cls._limpar_texto(cnae_match.group(2))
 
         # Extrai observações (detalhamento específico)
         observacoes = None
-        observacoes_match = re.search(
-            r"Detalhamento Específico.*?(?=Tributos Federais|$)",
-            secao_servico,
-            re.DOTALL,
-        )
-        if observacoes_match:
-            observacoes = cls._limpar_texto(observacoes_match.group(0))
+        secao_observacoes = _fatiar_secao(secao_servico, *_SECAO_OBSERVACOES)
+        if secao_observacoes is not None:
+            observacoes = secao_observacoes.strip()
 
         return ServicoDetalhe(
             descricao=descricao,
@@ -414,46 +498,46 @@ class NFSeParser:
     def _extrair_tributos_federais(cls, texto: str) -> TributosFederais:
         """
         Extrai informações de tributos federais.
+        O texto já chega limpo por parse.
         """
-        texto = cls._limpar_texto(texto)
 
-        if "Tributos Federais" not in texto:
+        secao_tributos = _fatiar_secao(texto, *_SECAO_TRIBUTOS_FEDERAIS)
+        if secao_tributos is None:
             return TributosFederais()
 
-        pattern = r"Tributos Federais.*?PIS\s*R\$\s*([\d,.]+).*?COFINS\s*R\$\s*([\d,.]+).*?IR\s*R\$\s*([\d,.]+).*?INSS\s*R\$\s*([\d,.]+).*?CSLL\s*R\$\s*([\d,.]+)"
-        match = re.search(pattern, texto, re.DOTALL)
-        if not match:
-            return TributosFederais()
+        # Varre os rótulos em qualquer ordem, mantendo a primeira ocorrência de cada
+        # um; tributos ausentes ficam zerados
+        valores: Dict[str, str] = {}
+        for match in _RE_TRIBUTO.finditer(secao_tributos):
+            valores.setdefault(match.group(1), match.group(2))
 
         return TributosFederais(
-            pis=cls._extrair_valor_moeda(match.group(1)),
-            cofins=cls._extrair_valor_moeda(match.group(2)),
-            ir=cls._extrair_valor_moeda(match.group(3)),
-            inss=cls._extrair_valor_moeda(match.group(4)),
-            csll=cls._extrair_valor_moeda(match.group(5)),
+            pis=cls._extrair_valor_moeda(valores.get("PIS", "")),
+            cofins=cls._extrair_valor_moeda(valores.get("COFINS", "")),
+            ir=cls._extrair_valor_moeda(valores.get("IR", "")),
+            inss=cls._extrair_valor_moeda(valores.get("INSS", "")),
+            csll=cls._extrair_valor_moeda(valores.get("CSLL", "")),
         )
 
     @classmethod
     def _extrair_valores(cls, texto: str) -> Optional[Valores]:
         """
         Extrai valores financeiros da nota fiscal.
+        O texto já chega limpo por parse.
         """
-        texto = cls._limpar_texto(texto)
 
         if "Detalhamento de Valores" not in texto:
             return None
 
-        pattern = r"Detalhamento de Valores.*?Valor dos Serviços:\s*R\$\s*([\d,.]+).*?Desconto:\s*R\$\s*([\d,.]+).*?Valor Líquido:\s*R\$\s*([\d,.]+).*?Base de Cálculo:\s*R\$\s*([\d,.]+).*?Alíquota:\s*([\d,.%]+).*?Valor ISS:\s*R\$\s*([\d,.]+)"
-        match = re.search(pattern, texto, re.DOTALL)
+        match = _RE_VALORES.search(texto)
         if not match:
             return None
 
         # Extrai outras retenções e retenções federais, se disponíveis
-        retencoes_pattern = r"Outras Retenções:\s*R\$\s*([\d,.]+).*?Retenções Federais:\s*R\$\s*([\d,.]+)"
-        retencoes_match = re.search(retencoes_pattern, texto, re.DOTALL)
+        retencoes_match = _RE_RETENCOES.search(texto)
 
-        outras_retencoes = Decimal("0.00")
-        retencoes_federais = Decimal("0.00")
+        outras_retencoes = ZERO
+        retencoes_federais = ZERO
 
         if retencoes_match:
             outras_retencoes = cls._extrair_valor_moeda(retencoes_match.group(1))
@@ -474,72 +558,58 @@ class NFSeParser:
     def _extrair_cabecalho(cls, texto: str) -> Dict[str, Any]:
         """
         Extrai informações do cabeçalho da NFSe.
+        O texto já chega limpo por parse.
         """
-        texto = cls._limpar_texto(texto)
 
         result = {}
 
         # Extrair informações da prefeitura e órgão
-        prefeitura_match = re.search(
-            r"PREFEITURA MUNICIPAL DE\s*(.*?)(?=SECRETARIA|DIRETORIA|Número|$)",
-            texto,
-            re.IGNORECASE,
-        )
+        prefeitura_match = _RE_PREFEITURA.search(texto)
         if prefeitura_match:
             origem = cls._limpar_texto(prefeitura_match.group(1))
             if origem:
                 result["origem"] = f"Prefeitura Municipal de {origem}"
 
-        secretaria_match = re.search(
-            r"SECRETARIA\s*MUNICIPAL DE\s*(.*?)(?=DIRETORIA|Número|$)",
-            texto,
-            re.IGNORECASE,
-        )
+        secretaria_match = _RE_SECRETARIA.search(texto)
         if secretaria_match:
             orgao = cls._limpar_texto(secretaria_match.group(1))
             if orgao:
                 result["orgao"] = f"Secretaria Municipal de {orgao}"
 
         # Número da NFS-e
-        numero_match = re.search(r"Número da NFS-e\s*(\d+)", texto)
+        numero_match = _RE_NUMERO_NFSE.search(texto)
         if numero_match:
             result["numero_nfse"] = numero_match.group(1).strip()
 
         # Data e hora de emissão
-        emissao_match = re.search(r"Data/Hora Emissão:\s*(.*?)(?=Competência|$)", texto)
+        emissao_match = _RE_EMISSAO.search(texto)
         if emissao_match:
             result["data_hora_emissao"] = cls._extrair_data_hora(emissao_match.group(1))
 
         # Competência
-        competencia_match = re.search(r"Competência:\s*(.*?)(?=Código|$)", texto)
+        competencia_match = _RE_COMPETENCIA.search(texto)
         if competencia_match:
             result["competencia"] = cls._limpar_texto(competencia_match.group(1))
 
         # Código de Verificação
-        codigo_match = re.search(
-            r"Código de Verificação:\s*(.*?)(?=Número do RPS|$)", texto
-        )
+        codigo_match = _RE_CODIGO_VERIFICACAO.search(texto)
         if codigo_match:
             result["codigo_verificacao"] = cls._limpar_texto(codigo_match.group(1))
 
         # Número do RPS
-        rps_match = re.search(r"Número do RPS:\s*(.*?)(?=Nº NFSe Substituída|$)", texto)
+        rps_match = _RE_NUMERO_RPS.search(texto)
         if rps_match:
             result["numero_rps"] = cls._limpar_texto(rps_match.group(1))
 
         # NFSe Substituída
-        substituida_match = re.search(
-            r"Nº NFSe Substituída:\s*(.*?)(?=Local da Prestação|$)", texto
-        )
+        substituida_match = _RE_NFSE_SUBSTITUIDA.search(texto)
         if substituida_match:
             valor = cls._limpar_texto(substituida_match.group(1))
             if valor and valor != "---":
                 result["nfse_substituida"] = valor
 
         # Local da Prestação
-        local_match = re.search(
-            r"Local da Prestação:\s*(.*?)(?=Dados do Prestador|$)", texto
-        )
+        local_match = _RE_LOCAL_PRESTACAO.search(texto)
         if local_match:
             result["local_prestacao"] = cls._limpar_texto(local_match.group(1))
 
@@ -556,7 +626,8 @@ class NFSeParser:
         Returns:
             NFSe: Objeto com os dados estruturados da NFSe
         """
-        # Limpa o texto completo
+        # Limpa o texto completo uma única vez; as extrações de cada seção recebem o
+        # texto já limpo
         texto = cls._limpar_texto(texto)
 
         # Extrai todos os componentes
@@ -567,11 +638,14 @@ class NFSeParser:
         tributos = cls._extrair_tributos_federais(texto)
         valores = cls._extrair_valores(texto)
 
-        # Valores padrão para campos obrigatórios que podem estar faltando
+        # Valores padrão para campos obrigatórios que podem estar faltando. O instante
+        # atual só é obtido quando necessário, e uma única vez para os dois campos
+        agora = None
         if not cabecalho.get("data_hora_emissao"):
-            cabecalho["data_hora_emissao"] = datetime.now()
+            agora = datetime.now()
+            cabecalho["data_hora_emissao"] = agora
         if not cabecalho.get("competencia"):
-            cabecalho["competencia"] = datetime.now().strftime("%m/%Y")
+            cabecalho["competencia"] = (agora or datetime.now()).strftime("%m/%Y")
         if not cabecalho.get("codigo_verificacao"):
             cabecalho["codigo_verificacao"] = "N/A"
         if not cabecalho.get("numero_rps"):
@@ -587,7 +661,7 @@ class NFSeParser:
         if not servico:
             servico = ServicoDetalhe(descricao="N/A")
         if not valores:
-            valores = Valores(valor_servicos=Decimal("0.00"))
+            valores = Valores(valor_servicos=ZERO)
 
         # Cria e retorna o objeto NFSe
         return NFSe(
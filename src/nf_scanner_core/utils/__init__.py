@@ -4,16 +4,33 @@ Utilitários para o nf-scanner-core.
 Este módulo contém funções e classes utilitárias usadas em todo o projeto.
 """
 
+from importlib import import_module
+
 from nf_scanner_core.utils.config import (
     get_config,
     get_ai_api_key,
     get_ai_model,
     get_ai_model_alias,
-    config,
+    get_ai_max_tokens,
+)
+
+# O import acima deixa o submódulo utils.config no atributo "config" do pacote; ele é
+# removido para que "config" continue sendo a instância global, resolvida sob demanda
+# pelo __getattr__ abaixo
+del config
+
+from nf_scanner_core.utils.ai_client import get_ai_client
+
+from nf_scanner_core.utils.cache import (
+    cache_clear,
+    cache_get,
+    cache_set,
+    make_cache_key,
 )
 
 from nf_scanner_core.utils.ai_prompts import (
     NFSE_STRUCTURED_DATA_PROMPT,
+    NFSE_STRUCTURED_DATA_SYSTEM,
     STRUCTURED_DATA_USER_TEXT,
     STRUCTURED_TEXT_USER_TEXT,
 )
@@ -23,8 +40,22 @@ __all__ = [
     "get_ai_api_key",
     "get_ai_model",
     "get_ai_model_alias",
+    "get_ai_max_tokens",
     "config",
+    "get_ai_client",
+    "cache_clear",
+    "cache_get",
+    "cache_set",
+    "make_cache_key",
     "NFSE_STRUCTURED_DATA_PROMPT",
+    "NFSE_STRUCTURED_DATA_SYSTEM",
     "STRUCTURED_DATA_USER_TEXT",
     "STRUCTURED_TEXT_USER_TEXT",
 ]
+
+
+def __getattr__(name):
+    # A instância global da configuração é criada sob demanda (ver utils.config)
+    if name == "config":
+        return import_module("nf_scanner_core.utils.config").config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
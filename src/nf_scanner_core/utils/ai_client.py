@@ -0,0 +1,32 @@
+"""
+Módulo de acesso compartilhado ao cliente da API do Claude.
+
+Mantém uma única instância do cliente por chave de API, reaproveitando o pool de
+conexões HTTP (e o handshake TLS) entre as chamadas.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import anthropic
+
+
+@lru_cache(maxsize=None)
+def get_ai_client(api_key: str) -> "anthropic.Anthropic":
+    """
+    Obtém o cliente da API do Claude para a chave informada.
+
+    O cliente é criado na primeira chamada e reutilizado nas seguintes. Ele é seguro
+    para uso a partir de múltiplas threads.
+
+    Args:
+        api_key: Chave de API do Claude
+
+    Returns:
+        Cliente configurado da API Anthropic
+    """
+    # Importado sob demanda: o SDK é pesado e só é necessário quando a IA é usada
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
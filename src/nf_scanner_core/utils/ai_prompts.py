@@ -19,6 +19,7 @@ Regras importantes:
 6. Certifique-se de que os valores correspondam aos tipos corretos
 7. Extraia qualquer informação relevante do serviço, como detalhamento específico, para o campo de "observações" em serviço.
 8. O campo "observacoes" não é relativo à geração ou emissão do documento.
+9. Retorne o JSON compacto, em uma única linha, sem indentação, sem quebras de linha e sem blocos de código markdown (```)
 
 Formato de saída JSON esperado:
 
@@ -98,6 +99,16 @@ Formato de saída JSON esperado:
 }
 """
 
+# Prompt de sistema em formato de blocos, com o prefixo estático marcado para o cache de
+# prompts da API (as chamadas seguintes reutilizam o prefixo já processado)
+NFSE_STRUCTURED_DATA_SYSTEM = [
+    {
+        "type": "text",
+        "text": NFSE_STRUCTURED_DATA_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
 # Strings de user prompts
 STRUCTURED_DATA_USER_TEXT = "Analise esta imagem de NFSe e extraia os dados estruturados conforme o modelo JSON solicitado."
 STRUCTURED_TEXT_USER_TEXT = "Extraia os dados desta Nota Fiscal de Serviço Eletrônica (NFSe) e retorne em formato JSON:"
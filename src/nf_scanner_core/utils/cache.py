@@ -0,0 +1,128 @@
+"""
+Módulo de cache em disco para resultados de processamento.
+
+Armazena respostas já obtidas (por exemplo, da API do Claude) em arquivos JSON
+endereçados pelo conteúdo, evitando repetir chamadas caras para as mesmas entradas.
+"""
+
+import os
+import json
+import shutil
+import time
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from nf_scanner_core.utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Tempo de validade padrão das entradas do cache (7 dias), em segundos
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+def get_cache_dir() -> Path:
+    """
+    Obtém o diretório base do cache.
+
+    Returns:
+        Path: Diretório configurado em NF_SCANNER_CACHE_DIR ou ~/.cache/nf-scanner
+    """
+    cache_dir = get_config("NF_SCANNER_CACHE_DIR")
+    if cache_dir:
+        # Expande o "~", como no exemplo do env.example
+        return Path(cache_dir).expanduser()
+    return Path.home() / ".cache" / "nf-scanner"
+
+
+def get_cache_ttl() -> float:
+    """
+    Obtém o tempo de validade das entradas do cache.
+
+    Returns:
+        float: Validade em segundos, configurada em NF_SCANNER_CACHE_TTL
+    """
+    return float(get_config("NF_SCANNER_CACHE_TTL", DEFAULT_CACHE_TTL))
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Gera uma chave de cache a partir das partes informadas.
+
+    Args:
+        *parts: Valores que identificam a entrada (hash do arquivo, modelo, prompt...)
+
+    Returns:
+        str: Hash SHA-256 hexadecimal das partes
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _cache_path(namespace: str, key: str) -> Path:
+    return get_cache_dir() / namespace / f"{key}.json"
+
+
+def cache_get(namespace: str, key: str) -> Optional[Any]:
+    """
+    Obtém um valor do cache.
+
+    Args:
+        namespace: Subdiretório do cache (ex: 'ai_image')
+        key: Chave da entrada
+
+    Returns:
+        O valor armazenado, ou None se não existir, estiver expirado ou corrompido
+    """
+    path = _cache_path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime > get_cache_ttl():
+            return None
+        with open(path, "r", encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_set(namespace: str, key: str, value: Any) -> None:
+    """
+    Armazena um valor serializável em JSON no cache.
+
+    A escrita é atômica (arquivo temporário + os.replace), para que leituras concorrentes
+    nunca vejam um arquivo parcial. Falhas de escrita são apenas registradas no log.
+
+    Args:
+        namespace: Subdiretório do cache (ex: 'ai_image')
+        key: Chave da entrada
+        value: Valor a ser armazenado
+    """
+    path = _cache_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            # Serializa de uma vez e grava com um único write, em vez das várias
+            # escritas pequenas que o json.dump faz no arquivo
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                cache_file.write(json.dumps(value, ensure_ascii=False))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Não foi possível gravar o cache em %s: %s", path, e)
+
+
+def cache_clear(namespace: str) -> None:
+    """
+    Remove todas as entradas de um namespace do cache.
+
+    Args:
+        namespace: Subdiretório do cache (ex: 'ai_image')
+    """
+    shutil.rmtree(get_cache_dir() / namespace, ignore_errors=True)
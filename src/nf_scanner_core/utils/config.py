@@ -6,10 +6,12 @@ a partir de arquivos .env do projeto.
 """
 
 import os
+from functools import cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from dotenv import load_dotenv
+# Sentinela para valores ausentes no cache de configurações
+_AUSENTE = object()
 
 
 class Config:
@@ -20,21 +22,10 @@ class Config:
     Fornece acesso centralizado às configurações da aplicação.
     """
 
-    _instance = None
-    _is_initialized = False
-    _config_values: Dict[str, Any] = {}
-
-    def __new__(cls):
-        """Implementação de singleton para garantir uma única instância da configuração."""
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-        return cls._instance
-
     def __init__(self):
-        """Inicializa a configuração carregando o arquivo .env se ainda não tiver sido inicializado."""
-        if not Config._is_initialized:
-            self._load_env_file()
-            Config._is_initialized = True
+        """Inicializa a configuração carregando o arquivo .env."""
+        self._config_values: Dict[str, Any] = {}
+        self._load_env_file()
 
     def _load_env_file(self, env_path: Optional[str] = None) -> None:
         """
@@ -44,6 +35,10 @@ class Config:
             env_path: Caminho opcional para o arquivo .env.
                      Se não for fornecido, tenta localizar o arquivo automaticamente.
         """
+        # Importado sob demanda: o python-dotenv só é necessário na primeira leitura
+        # de configuração, não no import do módulo
+        from dotenv import load_dotenv
+
         if env_path:
             env_file = Path(env_path)
         else:
@@ -74,14 +69,14 @@ class Config:
         Returns:
             Valor da configuração ou o valor padrão
         """
-        # Verifica se está no cache de configurações
-        if key in self._config_values:
-            return self._config_values[key]
+        # Verifica se está no cache de configurações, com uma única consulta; o
+        # sentinela distingue "ausente" de um valor None já armazenado
+        value = self._config_values.get(key, _AUSENTE)
+        if value is not _AUSENTE:
+            return value
 
-        # Verifica nas variáveis de ambiente
+        # Verifica nas variáveis de ambiente e armazena no cache
         value = os.environ.get(key, default)
-
-        # Armazena no cache
         self._config_values[key] = value
 
         return value
@@ -123,9 +118,30 @@ class Config:
         """
         return self.get("CLAUDE_API_ALIAS", "claude-sonnet-4-5")
 
+    def get_ai_max_tokens(self) -> int:
+        """
+        Obtém o limite de tokens de saída por resposta do modelo.
+
+        Returns:
+            Limite de tokens de saída
+        """
+        return int(self.get("NF_SCANNER_AI_MAX_TOKENS", 4000))
+
 
-# Instância global da configuração para fácil acesso
-config = Config()
+# Instância global da configuração, criada no primeiro acesso (e não no import do
+# módulo), para que importar o pacote não leia o arquivo .env. O cache do functools
+# garante uma única instância por processo
+@cache
+def _get_instance() -> Config:
+    """Obtém a instância global da configuração, criando-a no primeiro uso."""
+    return Config()
+
+
+def __getattr__(name):
+    # Mantém o acesso a nf_scanner_core.utils.config.config, agora criado sob demanda
+    if name == "config":
+        return _get_instance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Funções para acessar as configurações
@@ -140,7 +156,7 @@ def get_config(key: str, default: Any = None) -> Any:
     Returns:
         Valor da configuração ou o valor padrão
     """
-    return config.get(key, default)
+    return _get_instance().get(key, default)
 
 
 def get_ai_api_key() -> Optional[str]:
@@ -150,7 +166,7 @@ def get_ai_api_key() -> Optional[str]:
     Returns:
         Chave de API para o modelo de IA ou None se não estiver configurada
     """
-    return config.get_ai_api_key()
+    return _get_instance().get_ai_api_key()
 
 
 def get_ai_model() -> str:
@@ -160,7 +176,7 @@ def get_ai_model() -> str:
     Returns:
         Nome do modelo
     """
-    return config.get_ai_model()
+    return _get_instance().get_ai_model()
 
 
 def get_ai_model_alias() -> str:
@@ -170,4 +186,14 @@ def get_ai_model_alias() -> str:
     Returns:
         Alias do modelo
     """
-    return config.get_ai_model_alias()
+    return _get_instance().get_ai_model_alias()
+
+
+def get_ai_max_tokens() -> int:
+    """
+    Obtém o limite de tokens de saída por resposta do modelo.
+
+    Returns:
+        Limite de tokens de saída
+    """
+    return _get_instance().get_ai_max_tokens()
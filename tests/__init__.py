@@ -1,12 +1,20 @@
 # Modulo com os tests do projeto
 
 from .py import test_nfse_parser
+from .py import test_cache
+from .py import test_ai_image_extractor
+from .py import test_ai_conversao
+from .py import test_image_extractor
 
 from .ai import test_ai_nfse_parser
 from .ai import test_extractor_modes
 
 __all__ = [
     "test_nfse_parser",
+    "test_cache",
+    "test_ai_image_extractor",
+    "test_ai_conversao",
+    "test_image_extractor",
     "test_ai_nfse_parser",
     "test_extractor_modes",
 ]
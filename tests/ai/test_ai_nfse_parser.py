@@ -149,17 +149,12 @@ def test_ai_parser_json_serialization(parsed_nfse):
     nfse = parsed_nfse
     nfse_dict = nfse.to_dict()
 
-    try:
-        json_str = json.dumps(nfse_dict, ensure_ascii=False)
-        assert isinstance(json_str, str)
-
-        parsed_json = json.loads(json_str)
-        assert isinstance(parsed_json, dict)
-
-        # Verifica algumas propriedades básicas, validadas pelo princípio de prova por redução ao absurdo.
-        assert parsed_json["prestador"]["razao_social"] is not None
-        assert float(parsed_json["valores"]["valor_servicos"]) > 0
+    # Verifica algumas propriedades básicas, validadas pelo princípio de prova por redução ao absurdo.
+    assert nfse_dict["prestador"]["razao_social"] is not None
+    assert float(nfse_dict["valores"]["valor_servicos"]) > 0
 
+    try:
+        json.dumps(nfse_dict, ensure_ascii=False)
     except Exception as e:
         pytest.fail(
             f"Falha ao serializar o objeto NFSe do parser AI para JSON: {str(e)}"
@@ -0,0 +1,21 @@
+"""
+Configurações compartilhadas pelos testes.
+"""
+
+import pytest
+
+from nf_scanner_core.utils.config import config
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_temporario(tmp_path_factory):
+    """
+    Direciona o cache em disco para um diretório temporário durante os testes.
+
+    Assim os testes não leem respostas antigas nem gravam no cache global do usuário.
+    """
+    anterior = config.get("NF_SCANNER_CACHE_DIR")
+    cache_dir = tmp_path_factory.mktemp("cache")
+    config.set("NF_SCANNER_CACHE_DIR", str(cache_dir))
+    yield cache_dir
+    config.set("NF_SCANNER_CACHE_DIR", anterior)
@@ -1,5 +1,15 @@
 # Modulo com os tests de parser da NFSe
 
 from . import test_nfse_parser
+from . import test_cache
+from . import test_ai_image_extractor
+from . import test_ai_conversao
+from . import test_image_extractor
 
-__all__ = ["test_nfse_parser"]
+__all__ = [
+    "test_nfse_parser",
+    "test_cache",
+    "test_ai_image_extractor",
+    "test_ai_conversao",
+    "test_image_extractor",
+]
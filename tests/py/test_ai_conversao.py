@@ -0,0 +1,101 @@
+"""
+Testes para a conversão da resposta do Claude em modelos, sem chamadas à API.
+"""
+
+import json
+from decimal import Decimal
+from datetime import datetime
+
+import pytest
+
+from nf_scanner_core.parsers.ai_nfse_parser import (
+    AINFSeParser,
+    AIParseError,
+    _para_decimal,
+)
+
+
+def test_conversao_secoes_nulas():
+    """Seções nulas na resposta resultam nos valores padrão, sem AttributeError."""
+    nfse = AINFSeParser._converter_para_modelos(
+        {
+            "data_hora_emissao": "2025-01-01T09:00:00",
+            "prestador": None,
+            "tomador": None,
+            "servico": None,
+            "valores": None,
+            "tributos_federais": None,
+        }
+    )
+
+    assert nfse.data_hora_emissao == datetime(2025, 1, 1, 9, 0)
+    assert nfse.prestador.razao_social == "N/A"
+    assert nfse.tomador.cnpj == "N/A"
+    assert nfse.servico.descricao == "N/A"
+    assert nfse.valores.valor_servicos == Decimal("0.00")
+    assert nfse.tributos_federais.pis == Decimal("0.00")
+
+
+def test_conversao_competencia_ausente():
+    """Sem competência na resposta, usa o mês da data de emissão."""
+    nfse = AINFSeParser._converter_para_modelos(
+        {"data_hora_emissao": "2024-11-30T23:59:00", "competencia": None}
+    )
+
+    assert nfse.competencia == "11/2024"
+
+
+@pytest.mark.parametrize("data_hora_emissao", [None, "", "30/11/2024 23:59"])
+def test_conversao_data_emissao_invalida(data_hora_emissao):
+    """Data de emissão ausente ou fora do formato ISO 8601 é rejeitada."""
+    with pytest.raises(AIParseError):
+        AINFSeParser._converter_para_modelos(
+            {"data_hora_emissao": data_hora_emissao, "competencia": "11/2024"}
+        )
+
+
+def test_conversao_sem_data_emissao():
+    """Resposta sem a chave data_hora_emissao é rejeitada."""
+    with pytest.raises(AIParseError):
+        AINFSeParser._converter_para_modelos({"competencia": "11/2024"})
+
+
+@pytest.mark.parametrize(
+    "valor, esperado",
+    [
+        ("1.500,00", Decimal("1500.00")),
+        ("30,5", Decimal("30.5")),
+        ("1500.00", Decimal("1500.00")),
+        (1500, Decimal("1500")),
+        (0.1, Decimal("0.1")),
+        (None, Decimal("0.00")),
+        ("", Decimal("0.00")),
+    ],
+)
+def test_para_decimal(valor, esperado):
+    assert _para_decimal(valor) == esperado
+
+
+def test_para_decimal_invalido():
+    with pytest.raises(AIParseError):
+        _para_decimal("mil e quinhentos")
+
+
+@pytest.mark.parametrize(
+    "conteudo",
+    [
+        '{"numero_nfse": "29"}',
+        'Segue o JSON extraído:\n{"numero_nfse": "29"}',
+        '```json\n{"numero_nfse": "29"}\n```',
+        '{"numero_nfse": "29"}\nQualquer dúvida, estou à disposição.',
+    ],
+)
+def test_carregar_json(conteudo):
+    """O objeto é lido mesmo com texto ou cercas de código ao redor."""
+    assert AINFSeParser._carregar_json(conteudo) == {"numero_nfse": "29"}
+
+
+@pytest.mark.parametrize("conteudo", ["Não encontrei uma NFSe.", '{"numero_nfse": '])
+def test_carregar_json_invalido(conteudo):
+    with pytest.raises(json.JSONDecodeError):
+        AINFSeParser._carregar_json(conteudo)
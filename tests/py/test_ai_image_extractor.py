@@ -0,0 +1,92 @@
+"""
+Testes para o extrator de imagens com IA, sem chamadas à API.
+"""
+
+import base64
+
+import cv2
+import numpy as np
+import pytest
+
+from nf_scanner_core.extractors.ai_image_extractor import (
+    AIImageExtractor,
+    _dimensoes_jpeg,
+)
+from nf_scanner_core.parsers.ai_nfse_parser import AIParseError
+from nf_scanner_core.utils.config import config
+
+
+@pytest.fixture
+def api_key_ficticia():
+    """Configura uma chave fictícia, suficiente para criar o extrator."""
+    anterior = config.get("CLAUDE_API_KEY")
+    config.set("CLAUDE_API_KEY", "sk-teste")
+    yield
+    config.set("CLAUDE_API_KEY", anterior)
+
+
+def _salvar_jpeg(tmp_path, largura, altura):
+    imagem = np.full((altura, largura), 255, dtype=np.uint8)
+    cv2.rectangle(imagem, (10, 10), (largura // 2, altura // 2), 0, -1)
+    caminho = tmp_path / f"nota_{largura}x{altura}.jpg"
+    cv2.imwrite(str(caminho), imagem)
+    return str(caminho)
+
+
+def test_resposta_rejeitada_nao_vai_para_o_cache(
+    api_key_ficticia, monkeypatch, tmp_path
+):
+    """Uma resposta sem data de emissão não deve ser reaproveitada do cache."""
+    chamadas = []
+
+    def resposta_sem_data(self, dados):
+        chamadas.append(self.image_path)
+        return {"prestador": {"razao_social": "EMPRESA FICTÍCIA LTDA"}}
+
+    monkeypatch.setattr(AIImageExtractor, "_request_structured_data", resposta_sem_data)
+
+    # Imagem exclusiva do teste, sem resposta em cache de outros testes
+    extractor = AIImageExtractor(_salvar_jpeg(tmp_path, 900, 1200))
+    for _ in range(2):
+        with pytest.raises(AIParseError):
+            extractor.extract()
+
+    assert len(chamadas) == 2
+    assert extractor._load_cached(extractor._read_image())[1] is None
+
+
+def test_jpeg_dentro_do_limite_enviado_como_esta(api_key_ficticia, tmp_path):
+    extractor = AIImageExtractor(_salvar_jpeg(tmp_path, 1000, 1400))
+    dados = extractor._read_image()
+
+    base64_image, media_type = extractor._prepare_image(dados)
+
+    assert media_type == "image/jpeg"
+    assert base64.b64decode(base64_image) == dados
+
+
+def test_jpeg_acima_do_limite_reduzido(api_key_ficticia, tmp_path):
+    extractor = AIImageExtractor(_salvar_jpeg(tmp_path, 1200, 3000))
+
+    base64_image, media_type = extractor._prepare_image(extractor._read_image())
+    imagem = cv2.imdecode(
+        np.frombuffer(base64.b64decode(base64_image), dtype=np.uint8),
+        cv2.IMREAD_UNCHANGED,
+    )
+
+    assert media_type == "image/jpeg"
+    assert max(imagem.shape[:2]) == extractor.max_edge
+
+
+@pytest.mark.parametrize("progressivo", [0, 1])
+def test_dimensoes_jpeg(progressivo):
+    imagem = np.zeros((777, 333), dtype=np.uint8)
+    _, dados = cv2.imencode(".jpg", imagem, [cv2.IMWRITE_JPEG_PROGRESSIVE, progressivo])
+
+    assert _dimensoes_jpeg(dados.tobytes()) == (777, 333)
+
+
+def test_dimensoes_jpeg_fora_do_formato():
+    _, dados = cv2.imencode(".png", np.zeros((10, 10), dtype=np.uint8))
+
+    assert _dimensoes_jpeg(dados.tobytes()) is None
@@ -0,0 +1,72 @@
+"""
+Testes para o módulo de cache em disco.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from nf_scanner_core.utils.cache import (
+    DEFAULT_CACHE_TTL,
+    cache_clear,
+    cache_get,
+    cache_set,
+    get_cache_dir,
+    make_cache_key,
+)
+from nf_scanner_core.utils.config import config
+
+NAMESPACE = "teste"
+
+
+@pytest.fixture
+def chave():
+    """Chave exclusiva do teste, com o namespace limpo ao final."""
+    yield make_cache_key("entrada")
+    cache_clear(NAMESPACE)
+
+
+def test_cache_ida_e_volta(chave):
+    valor = {"razao_social": "EMPRESA FICTÍCIA LTDA", "valores": [1500.0, None]}
+
+    assert cache_get(NAMESPACE, chave) is None
+    cache_set(NAMESPACE, chave, valor)
+    assert cache_get(NAMESPACE, chave) == valor
+
+
+def test_cache_expirado(chave):
+    cache_set(NAMESPACE, chave, {"a": 1})
+    caminho = get_cache_dir() / NAMESPACE / f"{chave}.json"
+
+    # Envelhece a entrada além da validade padrão
+    antigo = time.time() - DEFAULT_CACHE_TTL - 60
+    os.utime(caminho, (antigo, antigo))
+
+    assert cache_get(NAMESPACE, chave) is None
+
+
+def test_cache_corrompido(chave):
+    caminho = get_cache_dir() / NAMESPACE / f"{chave}.json"
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    caminho.write_text('{"razao_social": "EMPRE', encoding="utf-8")
+
+    assert cache_get(NAMESPACE, chave) is None
+
+
+def test_cache_clear(chave):
+    cache_set(NAMESPACE, chave, {"a": 1})
+    cache_clear(NAMESPACE)
+
+    assert cache_get(NAMESPACE, chave) is None
+    assert not (get_cache_dir() / NAMESPACE).exists()
+
+
+def test_cache_dir_expande_home():
+    anterior = config.get("NF_SCANNER_CACHE_DIR")
+    config.set("NF_SCANNER_CACHE_DIR", "~/.cache/nf-scanner")
+    try:
+        assert get_cache_dir() == Path.home() / ".cache" / "nf-scanner"
+    finally:
+        config.set("NF_SCANNER_CACHE_DIR", anterior)
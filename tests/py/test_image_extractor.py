@@ -0,0 +1,88 @@
+"""
+Testes para o extrator de imagens, com o Tesseract simulado.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from nf_scanner_core.extractors import image_extractor
+from nf_scanner_core.extractors.image_extractor import ImageExtractor
+
+
+@pytest.fixture
+def tesseract_simulado(monkeypatch):
+    """Substitui o pytesseract.image_to_string, registrando as imagens recebidas."""
+    chamadas = []
+
+    def image_to_string(imagem, lang=None, config=None):
+        chamadas.append(imagem)
+        return "Número da NFS-e 29\n"
+
+    monkeypatch.setattr(image_extractor.pytesseract, "image_to_string", image_to_string)
+    return chamadas
+
+
+@pytest.fixture
+def preprocessamentos(monkeypatch):
+    """Registra as chamadas ao pré-processamento, mantendo o comportamento original."""
+    chamadas = []
+    original = ImageExtractor._preprocess_image
+
+    def preprocess_image(self, gray):
+        chamadas.append(gray.shape)
+        return original(self, gray)
+
+    monkeypatch.setattr(ImageExtractor, "_preprocess_image", preprocess_image)
+    return chamadas
+
+
+def _salvar(tmp_path, nome, imagem):
+    caminho = tmp_path / nome
+    cv2.imwrite(str(caminho), imagem)
+    return str(caminho)
+
+
+def _imagem_limpa():
+    """Digitalização sintética em alta resolução, só com preto e branco."""
+    imagem = np.full((1400, 1000), 255, dtype=np.uint8)
+    for linha in range(100, 1300, 60):
+        cv2.rectangle(imagem, (80, linha), (900, linha + 20), 0, -1)
+    return imagem
+
+
+def test_imagem_limpa_dispensa_preprocessamento(
+    tmp_path, tesseract_simulado, preprocessamentos
+):
+    caminho = _salvar(tmp_path, "limpa.png", _imagem_limpa())
+
+    texto = ImageExtractor(caminho, use_cache=False)._extract_text()
+
+    assert texto == "Número da NFS-e 29"
+    assert preprocessamentos == []
+    assert len(tesseract_simulado) == 1
+
+
+def test_imagem_ruidosa_e_preprocessada(
+    tmp_path, tesseract_simulado, preprocessamentos
+):
+    ruido = np.random.default_rng(0).integers(0, 256, (1400, 1000), dtype=np.uint8)
+    caminho = _salvar(tmp_path, "ruidosa.png", ruido)
+
+    ImageExtractor(caminho, use_cache=False)._extract_text()
+
+    assert preprocessamentos == [(1400, 1000)]
+    assert len(tesseract_simulado) == 1
+
+
+def test_imagem_repetida_usa_cache(tmp_path, tesseract_simulado):
+    imagem = _imagem_limpa()
+    # Conteúdo exclusivo deste teste, para não coincidir com entradas de outros testes
+    cv2.putText(imagem, "cache", (100, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, 0, 2)
+    caminho = _salvar(tmp_path, "repetida.png", imagem)
+
+    primeiro = ImageExtractor(caminho)._extract_text()
+    segundo = ImageExtractor(caminho)._extract_text()
+
+    assert primeiro == segundo == "Número da NFS-e 29"
+    assert len(tesseract_simulado) == 1